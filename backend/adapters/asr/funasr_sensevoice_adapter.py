@@ -10,6 +10,7 @@ from backend.core.models.exceptions import ModuleInitializationError, ModuleProc
 from backend.core.models import AudioData
 from backend.core.interfaces.base_asr import BaseASR
 from backend.utils.audio_converter import convert_audio_format
+from backend.utils.device import resolve_device
 from backend.utils.paths import resolve_project_path
 from backend.utils.logging_setup import logger
 
@@ -51,7 +52,8 @@ class FunASRSenseVoiceAdapter(BaseASR):
 
         # 读取 FunASR 特定配置
         self.model_dir: str = self.config.get("model_dir", self.DEFAULT_MODEL_DIR)
-        self.device: str = self.config.get("device", self.DEFAULT_DEVICE)
+        # 支持 "auto"：自动选择 cuda / mps / cpu
+        self.device: str = resolve_device(self.config.get("device", self.DEFAULT_DEVICE))
         self.vad_chunk_size: int | None = self.config.get("vad_chunk_size")
         self.output_dir: str | None = self.config.get("output_dir")
 
@@ -112,7 +114,7 @@ class FunASRSenseVoiceAdapter(BaseASR):
         # 预处理音频
         audio_array = self._preprocess(audio)
         if audio_array is None or audio_array.size == 0:
-            logger.debug(f"ASR/FunASR [{self.module_id}] 音频预处理后为空")
+            logger.debug("ASR/FunASR [%s] 音频预处理后为空", self.module_id)
             return ""
 
         # 执行推理
@@ -123,7 +125,7 @@ class FunASRSenseVoiceAdapter(BaseASR):
             text = self._extract_text(result)
 
             if text:
-                logger.debug(f"ASR/FunASR [{self.module_id}] 识别结果: '{text}'")
+                logger.debug("ASR/FunASR [%s] 识别结果: '%s'", self.module_id, text)
 
             return text
 
@@ -145,14 +147,14 @@ class FunASRSenseVoiceAdapter(BaseASR):
         """执行模型推理"""
         loop = asyncio.get_running_loop()
 
-        logger.debug(f"ASR/FunASR [{self.module_id}] 开始推理，音频形状: {audio_array.shape}")
+        logger.debug("ASR/FunASR [%s] 开始推理，音频形状: %s", self.module_id, audio_array.shape)
 
         result = await loop.run_in_executor(
             None,
             partial(self.model.generate, input=audio_array, fs=self.sample_rate)
         )
 
-        logger.debug(f"ASR/FunASR [{self.module_id}] 推理完成，结果: {result}")
+        logger.debug("ASR/FunASR [%s] 推理完成，结果: %s", self.module_id, result)
 
         return result
 
@@ -195,12 +195,13 @@ class LangChainLLMAdapter(BaseLLM):
             self._trim_history(session_id)
 
             # 流式生成（带重试）
-            full_response = ""
+            # 分片收集，结束后一次性拼接
+            response_parts: list[str] = []
             for retry in range(self.max_retries + 1):
                 try:
                     async for chunk in self.llm.astream(self.chat_histories[session_id]):
                         if hasattr(chunk, "content") and chunk.content:
-                            full_response += chunk.content
+                            response_parts.append(chunk.content)
                             yield TextData(
                                 text=chunk.content,
                                 chunk_id=session_id,
@@ -214,7 +215,7 @@ class LangChainLLMAdapter(BaseLLM):
                     else:
                         raise ModuleProcessingError(f"生成失败: {e}") from e
 
-            self.chat_histories[session_id].append(AIMessage(content=full_response))
+            self.chat_histories[session_id].append(AIMessage(content="".join(response_parts)))
             yield TextData(text="", chunk_id=session_id, is_final=True)
 
         except ModuleProcessingError:
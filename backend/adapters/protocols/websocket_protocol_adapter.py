@@ -25,6 +25,15 @@ class WebSocketProtocolAdapter(BaseProtocol[WebSocketServerProtocol]):
 
         self.server: Optional[websockets.WebSocketServer] = None
 
+        # 点对点会话默认不启用 permessage-deflate，省去每个连接的 zlib 上下文和压缩开销
+        self.compression: Optional[str] = self.config.get("compression")
+
+        # 连接级缓冲与心跳参数，未配置时使用 websockets 默认值
+        self.max_message_size: Optional[int] = self.config.get("websocket_max_message_size", 2 ** 20)
+        self.max_queue: Optional[int] = self.config.get("max_queue", 16)
+        self.ping_interval: Optional[float] = self.config.get("ping_interval", 20)
+        self.ping_timeout: Optional[float] = self.config.get("ping_timeout", 20)
+
         logger.info(
             f"Protocol/WebSocket [{self.module_id}] 配置加载完成: "
             f"{self.host}:{self.port}"
@@ -41,7 +50,16 @@ class WebSocketProtocolAdapter(BaseProtocol[WebSocketServerProtocol]):
             f"Protocol/WebSocket [{self.module_id}] 启动服务器: "
             f"ws://{self.host}:{self.port}"
         )
-        self.server = await websockets.serve(self._handle_client, self.host, self.port)
+        self.server = await websockets.serve(
+            self._handle_client,
+            self.host,
+            self.port,
+            compression=self.compression,
+            max_size=self.max_message_size,
+            max_queue=self.max_queue,
+            ping_interval=self.ping_interval,
+            ping_timeout=self.ping_timeout,
+        )
         logger.info(f"Protocol/WebSocket [{self.module_id}] 服务器已启动")
         await self.server.wait_closed()
 
@@ -80,7 +98,8 @@ class WebSocketProtocolAdapter(BaseProtocol[WebSocketServerProtocol]):
 
         except Exception as e:
             logger.error(
-                f"Protocol/WebSocket [{self.module_id}] 连接错误: {e}",
+                "Protocol/WebSocket [%s] 连接错误: %s",
+                self.module_id, e,
                 exc_info=True,
             )
 
@@ -100,12 +119,10 @@ class WebSocketProtocolAdapter(BaseProtocol[WebSocketServerProtocol]):
         try:
             await connection.send(message)
         except websockets.exceptions.ConnectionClosed:
-            logger.debug(
-                f"Protocol/WebSocket [{self.module_id}] 连接已关闭"
-            )
+            logger.debug("Protocol/WebSocket [%s] 连接已关闭", self.module_id)
         except Exception as e:
             logger.error(
-                f"Protocol/WebSocket [{self.module_id}] 发送消息失败: {e}"
+                "Protocol/WebSocket [%s] 发送消息失败: %s", self.module_id, e
             )
 
 
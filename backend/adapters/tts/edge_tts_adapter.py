@@ -4,6 +4,10 @@ import uuid
 from datetime import datetime
 from typing import Any, AsyncGenerator, Dict, Type
 
+import aiofiles
+import aiofiles.os
+from aiofiles.threadpool.binary import AsyncBufferedIOBase
+
 from backend.core.models.exceptions import ModuleInitializationError, ModuleProcessingError
 from backend.core.models import AudioData, TextData, AudioFormat
 from backend.core.interfaces.base_tts import BaseTTS
@@ -149,33 +153,61 @@ class EdgeTTSAdapter(BaseTTS):
         )
 
         chunk_index = 0
-        audio_buffer: list[bytes] = []  # 用于保存音频数据
-
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_bytes = chunk["data"]
-                if audio_bytes:
-                    logger.debug(
-                        f"TTS/EdgeTTS [{self.module_id}] 生成音频块 {chunk_index}: {len(audio_bytes)} 字节"
-                    )
-                    # 收集音频数据用于保存
-                    if self.save_audio:
-                        audio_buffer.append(audio_bytes)
-
-                    yield AudioData(
-                        data=audio_bytes,
-                        format=self.output_format,
-                        is_final=False,
-                        metadata={"chunk_index": chunk_index}
-                    )
-                    chunk_index += 1
+        total_bytes = 0
+
+        # 边合成边写入文件，避免缓存全部音频块后再同步写盘阻塞事件循环
+        saved_path: str | None = None
+        audio_file: AsyncBufferedIOBase | None = None
+        if self.save_audio:
+            saved_path = self._build_audio_filepath(text.text)
+            audio_file = await self._open_audio_file(saved_path)
+            if audio_file is None:
+                saved_path = None
+
+        try:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio_bytes = chunk["data"]
+                    if audio_bytes:
+                        logger.debug(
+                            "TTS/EdgeTTS [%s] 生成音频块 %d: %d 字节",
+                            self.module_id, chunk_index, len(audio_bytes)
+                        )
+                        if audio_file is not None:
+                            try:
+                                await audio_file.write(audio_bytes)
+                                total_bytes += len(audio_bytes)
+                            except Exception as e:
+                                logger.error(
+                                    "TTS/EdgeTTS [%s] 保存音频失败: %s", self.module_id, e, exc_info=True
+                                )
+                                await self._discard_audio_file(audio_file, saved_path)
+                                audio_file = saved_path = None
+
+                        yield AudioData(
+                            data=audio_bytes,
+                            format=self.output_format,
+                            is_final=False,
+                            metadata={"chunk_index": chunk_index}
+                        )
+                        chunk_index += 1
+        except BaseException:
+            # 合成中断时删除不完整的音频文件（重试会重新生成）
+            if audio_file is not None:
+                await self._discard_audio_file(audio_file, saved_path)
+            raise
 
         logger.debug(f"TTS/EdgeTTS [{self.module_id}] 合成结束，共 {chunk_index} 个音频块")
 
-        # 保存音频文件
-        saved_path: str | None = None
-        if self.save_audio and audio_buffer:
-            saved_path = self._save_audio_file(audio_buffer, text.text)
+        if audio_file is not None:
+            if chunk_index:
+                await audio_file.close()
+                logger.info(
+                    "TTS/EdgeTTS [%s] 音频已保存: %s (%d 字节)", self.module_id, saved_path, total_bytes
+                )
+            else:
+                await self._discard_audio_file(audio_file, saved_path)
+                saved_path = None
 
         # 发送最终标记
         yield AudioData(
@@ -189,39 +221,44 @@ class EdgeTTSAdapter(BaseTTS):
             }
         )
 
-    def _save_audio_file(self, audio_chunks: list[bytes], text: str) -> str | None:
-        """保存音频文件到指定目录
+    def _build_audio_filepath(self, text: str) -> str:
+        """生成音频保存路径
 
         Args:
-            audio_chunks: 音频数据块列表
             text: 原始文本（用于生成文件名）
 
         Returns:
-            保存的文件路径，失败返回 None
+            文件路径，格式为 时间戳_UUID_文本前缀.mp3
         """
-        try:
-            # 生成文件名: 时间戳_UUID_文本前缀.mp3
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            short_id = str(uuid.uuid4())[:8]
-            # 取文本前10个字符作为文件名一部分，过滤特殊字符
-            text_prefix = "".join(c for c in text[:10] if c.isalnum() or c in "_ ")
-            text_prefix = text_prefix.strip().replace(" ", "_") or "audio"
-
-            filename = f"{timestamp}_{short_id}_{text_prefix}.mp3"
-            filepath = os.path.join(self.save_path, filename)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        short_id = str(uuid.uuid4())[:8]
+        # 取文本前10个字符作为文件名一部分，过滤特殊字符
+        text_prefix = "".join(c for c in text[:10] if c.isalnum() or c in "_ ")
+        text_prefix = text_prefix.strip().replace(" ", "_") or "audio"
 
-            # 合并并写入文件
-            audio_data = b"".join(audio_chunks)
-            with open(filepath, "wb") as f:
-                f.write(audio_data)
+        filename = f"{timestamp}_{short_id}_{text_prefix}.mp3"
+        return os.path.join(self.save_path, filename)
 
-            logger.info(f"TTS/EdgeTTS [{self.module_id}] 音频已保存: {filepath} ({len(audio_data)} 字节)")
-            return filepath
+    async def _open_audio_file(self, filepath: str) -> AsyncBufferedIOBase | None:
+        """异步打开音频保存文件
 
+        Returns:
+            aiofiles 文件对象，失败返回 None
+        """
+        try:
+            return await aiofiles.open(filepath, "wb")
         except Exception as e:
-            logger.error(f"TTS/EdgeTTS [{self.module_id}] 保存音频失败: {e}", exc_info=True)
+            logger.error("TTS/EdgeTTS [%s] 保存音频失败: %s", self.module_id, e, exc_info=True)
             return None
 
+    async def _discard_audio_file(self, audio_file: AsyncBufferedIOBase, filepath: str) -> None:
+        """关闭并删除不完整的音频文件"""
+        try:
+            await audio_file.close()
+            await aiofiles.os.remove(filepath)
+        except Exception as e:
+            logger.warning("TTS/EdgeTTS [%s] 清理音频文件失败: %s", self.module_id, e)
+
 
 def load() -> Type[BaseTTS]:
     """加载 EdgeTTS 适配器类"""
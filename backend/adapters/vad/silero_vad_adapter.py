@@ -6,6 +6,7 @@ import torch
 
 from backend.core.models.exceptions import ModuleInitializationError, ModuleProcessingError
 from backend.core.interfaces.base_vad import BaseVAD
+from backend.utils.device import resolve_device
 from backend.utils.logging_setup import logger
 from backend.utils.paths import resolve_project_path
 
@@ -33,7 +34,7 @@ class SileroVADAdapter(BaseVAD):
         # 读取 Silero VAD 特定配置
         self.model_repo_path: str = self.config.get("model_repo_path", self.DEFAULT_MODEL_REPO)
         self.model_name: str = self.config.get("model_name", self.DEFAULT_MODEL_NAME)
-        self.device: str = self.config.get("device", self.DEFAULT_DEVICE)
+        self.device: str = resolve_device(self.config.get("device", self.DEFAULT_DEVICE))
         self.force_reload: bool = self.config.get("force_reload_model", False)
 
         # 错误处理配置
@@ -49,6 +50,8 @@ class SileroVADAdapter(BaseVAD):
         self.window_size_samples: int = self.config.get("window_size_samples", default_window)
 
         self.model: torch.nn.Module | None = None
+        # 最近一次 detect 的语音概率，便于调试/测试读取而无需再次推理
+        self.last_speech_prob: float | None = None
 
         logger.info(f"VAD/Silero [{self.module_id}] 配置加载完成:")
         logger.info(f"  - model_repo: {self.model_repo_path}")
@@ -111,8 +114,9 @@ class SileroVADAdapter(BaseVAD):
 
         try:
             # 转换音频数据
+            # 一次 ufunc 完成 int16 -> 归一化 float32，避免 astype 再相除产生中间数组
             audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
+            audio_float32 = np.divide(audio_int16, 32768.0, dtype=np.float32)
             audio_tensor = torch.from_numpy(audio_float32).to(self.device)
 
             # 处理维度
@@ -145,11 +149,13 @@ class SileroVADAdapter(BaseVAD):
                 speech_prob_tensor = self.model(audio_tensor, self.sample_rate)
                 speech_prob = speech_prob_tensor.item()
 
+            self.last_speech_prob = speech_prob
             is_speech = speech_prob >= self.threshold
 
+            # 每个音频窗口都会调用，使用惰性格式化，DEBUG 未开启时不拼接字符串
             logger.debug(
-                f"VAD/Silero [{self.module_id}] 检测结果: "
-                f"is_speech={is_speech}, prob={speech_prob:.4f}, threshold={self.threshold}"
+                "VAD/Silero [%s] 检测结果: is_speech=%s, prob=%.4f, threshold=%s",
+                self.module_id, is_speech, speech_prob, self.threshold
             )
 
             # 成功执行，重置失败计数
@@ -158,6 +164,7 @@ class SileroVADAdapter(BaseVAD):
             return is_speech
 
         except Exception as e:
+            self.last_speech_prob = None
             self.consecutive_failures += 1
             logger.error(
                 f"VAD/Silero [{self.module_id}] 检测失败 ({self.consecutive_failures}/{self.max_consecutive_failures}): {e}",
@@ -175,6 +182,7 @@ class SileroVADAdapter(BaseVAD):
         if self.model and hasattr(self.model, "reset_states"):
             self.model.reset_states()
             logger.debug(f"VAD/Silero [{self.module_id}] 模型状态已重置")
+        self.last_speech_prob = None
         await super().reset_state()
 
     async def _close_impl(self) -> None:
@@ -15,10 +15,15 @@
     # 获取模块（带类型检查）
     from backend.core.interfaces.base_llm import BaseLLM
     llm = AppContext.get_module_typed("llm", BaseLLM)
+
+    # 临时替换模块（测试用，退出时自动恢复）
+    with AppContext.scope({"llm": mock_llm}):
+        ...
 """
 
+from contextlib import contextmanager
 from threading import RLock
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, Iterator, Optional, Type, TypeVar
 
 T = TypeVar("T")
 
@@ -129,3 +134,24 @@ class AppContext:
         """清空全局上下文（测试用）"""
         with cls._lock:
             cls._modules.clear()
+
+    @classmethod
+    @contextmanager
+    def scope(cls, modules: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+        """临时替换全局模块，退出时恢复之前的模块（测试用）
+
+        Args:
+            modules: 作用域内使用的模块字典，默认为空
+
+        Example:
+            with AppContext.scope({"llm": mock_llm}):
+                assert AppContext.get_module("llm") is mock_llm
+        """
+        with cls._lock:
+            previous = cls._modules
+            cls._modules = dict(modules or {})
+        try:
+            yield
+        finally:
+            with cls._lock:
+                cls._modules = previous
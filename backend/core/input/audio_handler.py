@@ -69,7 +69,6 @@ class AudioInputHandler:
         # 任务管理
         self.monitor_task: Optional[asyncio.Task] = None
         self.client_speech_ended = asyncio.Event()
-        self._pending_tasks: set[asyncio.Task] = set()
 
     def start(self) -> None:
         """启动音频处理"""
@@ -79,15 +78,6 @@ class AudioInputHandler:
 
     async def stop(self) -> None:
         """停止音频处理"""
-        # 取消所有待处理任务
-        for task in list(self._pending_tasks):
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-        self._pending_tasks.clear()
-
         # 取消监控任务
         if self.monitor_task:
             self.monitor_task.cancel()
@@ -125,9 +115,9 @@ class AudioInputHandler:
 
                 self.audio_buffer.append(chunk)
                 self.last_speech_time = time.time()
-            logger.debug(f"[AudioInput] Speech detected, session={self.session_context.session_id}")
+            logger.debug("[AudioInput] Speech detected, session=%s", self.session_context.session_id)
         else:
-            logger.debug(f"[AudioInput] No speech, session={self.session_context.session_id}")
+            logger.debug("[AudioInput] No speech, session=%s", self.session_context.session_id)
 
     def signal_client_speech_end(self) -> None:
         """客户端信号：语音结束"""
@@ -135,33 +125,24 @@ class AudioInputHandler:
         self.client_speech_ended.set()
 
     async def _monitor_loop(self) -> None:
-        """监控循环 - 定期检查是否应该触发 ASR"""
+        """监控循环 - 定期检查是否应该触发 ASR
+
+        按单调时钟的固定节拍调度：每轮只等待距下一个检查时刻的剩余时间，
+        检查本身的耗时不会累积成漂移。
+        """
+        loop = asyncio.get_running_loop()
+        interval = self.DEFAULT_CHECK_INTERVAL
+        next_check = loop.time() + interval
         try:
             while True:
-                # 创建任务并跟踪
-                sleep_task = asyncio.create_task(asyncio.sleep(self.DEFAULT_CHECK_INTERVAL))
-                wait_task = asyncio.create_task(self.client_speech_ended.wait())
-                self._pending_tasks.add(sleep_task)
-                self._pending_tasks.add(wait_task)
-
-                try:
-                    # 等待检查间隔或客户端结束信号
-                    done, pending = await asyncio.wait(
-                        [sleep_task, wait_task],
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-
-                    # 取消未完成的任务
-                    for task in pending:
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-                finally:
-                    # 清理任务跟踪
-                    self._pending_tasks.discard(sleep_task)
-                    self._pending_tasks.discard(wait_task)
+                # 等待到下一个检查时刻，或提前收到客户端结束信号
+                delay = next_check - loop.time()
+                if delay > 0 and not self.client_speech_ended.is_set():
+                    try:
+                        async with asyncio.timeout(delay):
+                            await self.client_speech_ended.wait()
+                    except TimeoutError:
+                        pass
 
                 # 检查是否应该处理
                 client_ended = self.client_speech_ended.is_set()
@@ -171,6 +152,12 @@ class AudioInputHandler:
                 if client_ended:
                     self.client_speech_ended.clear()
 
+                # 推进到下一个节拍；处理耗时超过一个周期时从当前时间重新对齐
+                next_check += interval
+                now = loop.time()
+                if next_check <= now:
+                    next_check = now + interval
+
         except asyncio.CancelledError:
             logger.info(f"[AudioInput] Monitor loop cancelled, session={self.session_context.session_id}")
         except Exception as e:
@@ -30,6 +30,14 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
     - send_message: 发送消息到连接
     """
 
+    # 协议层自行处理的事件类型 -> 处理方法名，其余事件路由到 ConversationHandler
+    _SYSTEM_EVENT_HANDLERS: Dict[EventType, str] = {
+        EventType.SYSTEM_CLIENT_SESSION_START: "_handle_register",
+        EventType.CONFIG_GET: "_handle_config_get",
+        EventType.CONFIG_SET: "_handle_config_set",
+        EventType.MODULE_STATUS_GET: "_handle_module_status_get",
+    }
+
     def __init__(
         self,
         module_id: str,
@@ -94,21 +102,12 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
 
             stream_event = StreamEvent.model_validate_json(raw_message)
 
-            # 判断是否为注册消息
-            if stream_event.event_type == EventType.SYSTEM_CLIENT_SESSION_START:
-                await self._handle_register(connection, stream_event)
-            elif stream_event.event_type == EventType.CONFIG_GET:
-                await self._handle_config_get(connection, stream_event)
-            elif stream_event.event_type == EventType.CONFIG_SET:
-                await self._handle_config_set(connection, stream_event)
-            elif stream_event.event_type == EventType.MODULE_STATUS_GET:
-                await self._handle_module_status_get(connection, stream_event)
-            else:
-                # 路由到 ConversationHandler
-                await self._route_message(connection, stream_event)
+            # 查表分发，未登记的事件路由到 ConversationHandler
+            handler_name = self._SYSTEM_EVENT_HANDLERS.get(stream_event.event_type, "_route_message")
+            await getattr(self, handler_name)(connection, stream_event)
 
         except Exception as e:
-            logger.error(f"Protocol [{self.module_id}] 消息处理失败: {e}", exc_info=True)
+            logger.error("Protocol [%s] 消息处理失败: %s", self.module_id, e, exc_info=True)
 
     async def _handle_register(self, connection: ConnectionT, stream_event: StreamEvent) -> None:
         """处理注册消息（通用方法）"""
@@ -143,7 +142,7 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
         )
         await self.send_event(session_id, response)
 
-        logger.info(f"Protocol [{self.module_id}] 客户端已注册: tag={tag_id}, session={session_id}")
+        logger.info("Protocol [%s] 客户端已注册: tag=%s, session=%s", self.module_id, tag_id, session_id)
 
     async def _handle_config_get(self, connection: ConnectionT, stream_event: StreamEvent) -> None:
         """处理获取配置请求"""
@@ -303,12 +302,12 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
         """路由消息到 ConversationHandler（通用方法）"""
         session_id = self.get_session_id(connection)
         if not session_id:
-            logger.warning(f"Protocol [{self.module_id}] 未找到会话映射")
+            logger.warning("Protocol [%s] 未找到会话映射", self.module_id)
             return
 
         handler = self.conversation_manager.get_conversation_handler(session_id)
         if not handler:
-            logger.warning(f"Protocol [{self.module_id}] 会话处理器不存在: {session_id}")
+            logger.warning("Protocol [%s] 会话处理器不存在: %s", self.module_id, session_id)
             return
 
         # 根据事件类型分发
@@ -334,7 +333,7 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
         """处理断开连接（通用方法）"""
         session_id = self.remove_session_by_connection(connection)
         if session_id:
-            logger.info(f"Protocol [{self.module_id}] 连接断开: session={session_id}")
+            logger.info("Protocol [%s] 连接断开: session=%s", self.module_id, session_id)
             await self.conversation_manager.destroy_conversation_handler(session_id)
 
     # ==================== 通用会话管理 ====================
@@ -355,8 +354,8 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
         self.connection_to_session[connection] = session_id
 
         logger.debug(
-            f"Protocol [{self.module_id}] 创建会话: "
-            f"session={session_id}, tag={tag_id}"
+            "Protocol [%s] 创建会话: session=%s, tag=%s",
+            self.module_id, session_id, tag_id
         )
 
         return session_id
@@ -384,9 +383,7 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
         if tag_to_remove:
             self.tag_to_session.pop(tag_to_remove, None)
 
-        logger.debug(
-            f"Protocol [{self.module_id}] 移除会话: {session_id}"
-        )
+        logger.debug("Protocol [%s] 移除会话: %s", self.module_id, session_id)
 
     def remove_session_by_connection(self, connection: ConnectionT) -> Optional[str]:
         """通过连接移除会话"""
@@ -403,9 +400,7 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
             if tag_to_remove:
                 self.tag_to_session.pop(tag_to_remove, None)
 
-            logger.debug(
-                f"Protocol [{self.module_id}] 移除会话: {session_id}"
-            )
+            logger.debug("Protocol [%s] 移除会话: %s", self.module_id, session_id)
 
         return session_id
 
@@ -432,7 +427,7 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
         connection = self.get_connection(session_id)
         if not connection:
             logger.warning(
-                f"Protocol [{self.module_id}] 会话 {session_id} 的连接不存在"
+                "Protocol [%s] 会话 %s 的连接不存在", self.module_id, session_id
             )
             return False
 
@@ -441,7 +436,7 @@ class BaseProtocol(BaseModule, Generic[ConnectionT]):
             return True
         except Exception as e:
             logger.error(
-                f"Protocol [{self.module_id}] 发送事件失败 "
-                f"(session: {session_id}): {e}"
+                "Protocol [%s] 发送事件失败 (session: %s): %s",
+                self.module_id, session_id, e
             )
             return False
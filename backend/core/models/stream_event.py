@@ -14,6 +14,15 @@ from pydantic import BaseModel, Field, model_validator
 from backend.core.models.audio_data import AudioData
 from backend.core.models.text_data import TextData
 
+# 优先使用 orjson 加速序列化（可选依赖: pip install chat-bot[speedups]），未安装时回退到标准库 json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 
 class EventType(str, Enum):
     """定义系统中流转的事件类型"""
@@ -158,6 +167,11 @@ class StreamEvent(BaseModel):
         elif isinstance(self.event_data, dict):
             event_dict['event_data'] = self.event_data
 
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(event_dict, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+            except TypeError:
+                pass  # orjson 不支持的值（如超过 64 位的整数），交给标准库处理
         return json.dumps(event_dict, ensure_ascii=False)
 
     @classmethod
@@ -170,7 +184,14 @@ class StreamEvent(BaseModel):
         Returns:
             StreamEvent 实例
         """
-        data = json.loads(json_str)
+        data = None
+        if ORJSON_AVAILABLE:
+            try:
+                data = orjson.loads(json_str)
+            except orjson.JSONDecodeError:
+                pass  # orjson 拒绝 NaN 等标准库可接受的输入，交给标准库解析并报告错误
+        if data is None:
+            data = json.loads(json_str)
         return cls.model_validate(data)
 
     @classmethod
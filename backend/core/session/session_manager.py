@@ -1,6 +1,6 @@
+from collections import OrderedDict
 from typing import Optional, Protocol
 
-from cachetools import LRUCache
 from backend.utils.logging_setup import logger
 
 
@@ -15,17 +15,28 @@ class StorageBackend(Protocol):
 
 
 class InMemoryStorage(StorageBackend):
-    """内存存储：使用 LRU 缓存"""
+    """内存存储：基于 OrderedDict 的 LRU 缓存
+
+    get/set 都会把 key 移到末尾（最近使用），超出容量时从头部淘汰，
+    所有操作均为 O(1)。
+    """
 
     def __init__(self, maxsize: int = 256):
-        self._cache = LRUCache(maxsize=maxsize)
+        self.maxsize = maxsize
+        self._cache: OrderedDict[str, 'SessionContext'] = OrderedDict()
         logger.info(f"[SessionStorage] 内存存储初始化，最大容量: {maxsize}")
 
     def get(self, key: str) -> Optional['SessionContext']:
-        return self._cache.get(key)
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
 
     def set(self, key: str, value: 'SessionContext'):
         self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
 
     def close(self):
         logger.info("[SessionStorage] 关闭内存存储")
@@ -32,6 +32,7 @@ def run_server() -> None:
     from backend.utils.logging_setup import logger, setup_logging
     from backend.core.engine.chat_engine import ChatEngine
     from backend.core.session.session_manager import SessionManager, InMemoryStorage
+    from backend.utils.event_loop import get_loop_factory
 
     async def start_server() -> None:
         logger.info("--- Chat Bot Server Starting ---")
@@ -83,7 +84,7 @@ def run_server() -> None:
             sys.exit(1)
 
     try:
-        asyncio.run(start_server())
+        asyncio.run(start_server(), loop_factory=get_loop_factory())
     except KeyboardInterrupt:
         print("\nServer stopped by user (Ctrl+C).")
     except Exception as e:
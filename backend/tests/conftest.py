@@ -7,16 +7,13 @@ from backend.utils.config_loader import ConfigLoader
 from backend.core.interfaces.base_llm import BaseLLM
 from backend.core.interfaces.base_tts import BaseTTS
 
+TEST_CONFIG_PATH = Path(__file__).resolve().parent.parent / "configs" / "test_config.yaml"
+
 @pytest.fixture(autouse=True)
 def clean_app_context():
-    """每个测试前后自动清理 AppContext"""
-    # Setup - ensure clean state before test
-    AppContext.clear()
-
-    yield
-
-    # Teardown - ensure clean state after test
-    AppContext.clear()
+    """每个测试在独立的 AppContext 作用域中运行，结束后自动恢复"""
+    with AppContext.scope():
+        yield
 
 @pytest.fixture
 def session_manager():
@@ -30,9 +27,8 @@ def session_manager():
 @pytest.fixture
 async def test_config():
     """加载 backend/configs/test_config.yaml 配置（如果存在）"""
-    config_path = Path(__file__).parent / ".." / "configs" / "test_config.yaml"
-    if config_path.exists():
-        return await ConfigLoader.load_config(str(config_path))
+    if TEST_CONFIG_PATH.exists():
+        return await ConfigLoader.load_config(str(TEST_CONFIG_PATH))
 
     # Return a default minimal valid config structure if file doesn't exist
     # This ensures tests depending on this fixture don't crash without the file
@@ -23,14 +23,9 @@ class TestChatEngineIntegration:
 
     def setup_method(self):
         """每个测试前初始化"""
-        AppContext.clear()
         self.storage = InMemoryStorage()
         self.session_manager = SessionManager(storage_backend=self.storage)
 
-    def teardown_method(self):
-        """每个测试后清空"""
-        AppContext.clear()
-
     async def test_chat_engine_initialization(self):
         """测试 ChatEngine 初始化"""
         config = {
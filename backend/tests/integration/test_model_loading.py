@@ -3,30 +3,28 @@
 确保模型路径配置正确，模型可以正常加载。
 """
 
+import asyncio
 import os
-import sys
 from pathlib import Path
 
 import pytest
 
-# 添加项目根目录到路径
+# 项目根目录（导入路径由 pyproject.toml 的 pytest pythonpath 配置提供）
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
+CONFIG_PATH = PROJECT_ROOT / "backend" / "configs" / "config.yaml"
 
-class TestModelPaths:
-    """测试模型路径配置"""
 
-    @pytest.fixture
-    def config(self):
-        """加载配置"""
-        import asyncio
-        from backend.utils.config_loader import ConfigLoader
+@pytest.fixture
+def config():
+    """加载配置（ConfigLoader 按文件 mtime 缓存解析结果，每次返回深拷贝）"""
+    from backend.utils.config_loader import ConfigLoader
+
+    return asyncio.run(ConfigLoader.load_config(str(CONFIG_PATH)))
+
 
-        config_path = PROJECT_ROOT / "backend" / "configs" / "config.yaml"
-        return asyncio.get_event_loop().run_until_complete(
-            ConfigLoader.load_config(str(config_path))
-        )
+class TestModelPaths:
+    """测试模型路径配置"""
 
     def test_asr_model_path_exists(self, config):
         """测试 ASR 模型路径是否存在"""
@@ -66,17 +64,6 @@ class TestModelPaths:
 class TestModuleInitialization:
     """测试模块初始化"""
 
-    @pytest.fixture
-    def config(self):
-        """加载配置"""
-        import asyncio
-        from backend.utils.config_loader import ConfigLoader
-
-        config_path = PROJECT_ROOT / "backend" / "configs" / "config.yaml"
-        return asyncio.get_event_loop().run_until_complete(
-            ConfigLoader.load_config(str(config_path))
-        )
-
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="需要 FunASR 模型且可能存在 PyTorch 兼容性问题")
     async def test_asr_module_initialization(self, config):
@@ -0,0 +1,154 @@
+"""
+真实模块性能回归基准
+
+使用 pytest-benchmark 记录 VAD / ASR / TTS 单次调用的耗时（min / median 等），
+用于发现性能回归。pytest-benchmark 包含在 dev 依赖中，未安装时整个模块跳过:
+
+    pip install -e ".[dev]"
+    python -m pytest backend/tests/test_real_benchmarks.py --benchmark-only
+
+模型或网络不可用时对应的基准会被跳过。所有基准共用一个事件循环，
+避免每轮 asyncio.run() 创建事件循环和默认线程池的开销混入测量结果。
+"""
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# 项目根目录（导入路径由 pyproject.toml 的 pytest pythonpath 配置提供）
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+SAMPLE_RATE = 16000
+VAD_WINDOW_SAMPLES = 512
+
+# 基准使用的固定输入
+_VAD_TONE = (
+    32767 * 0.5 * np.sin(2 * np.pi * 440 * np.arange(VAD_WINDOW_SAMPLES) / SAMPLE_RATE)
+).astype('<i2').tobytes()
+_ASR_SILENCE = bytes(SAMPLE_RATE * 2)  # 1 秒静音
+_TTS_TEXT = "你好"
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """模块内共用的事件循环"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.run_until_complete(loop.shutdown_default_executor())
+    loop.close()
+
+
+def _setup_adapter(loop, adapter):
+    """初始化适配器，失败时跳过基准"""
+    try:
+        loop.run_until_complete(adapter.setup())
+    except Exception as e:
+        pytest.skip(f"{adapter.module_id} 初始化失败: {e}")
+    return adapter
+
+
+@pytest.fixture(scope="module")
+def vad_adapter(loop):
+    pytest.importorskip("torch")
+    from backend.adapters.vad.silero_vad_adapter import SileroVADAdapter
+
+    adapter = _setup_adapter(loop, SileroVADAdapter('bench_vad', {
+        'model_repo_path': str(PROJECT_ROOT / 'outputs/models/vad/silero-vad'),
+        'model_name': 'silero_vad',
+        'threshold': 0.5,
+        'vad_sample_rate': SAMPLE_RATE,
+        'window_size_samples': VAD_WINDOW_SAMPLES,
+        'device': 'cpu',
+    }))
+    yield adapter
+    loop.run_until_complete(adapter.close())
+
+
+@pytest.fixture(scope="module")
+def asr_adapter(loop):
+    from backend.adapters.asr.funasr_sensevoice_adapter import (
+        FUNASR_AVAILABLE,
+        FunASRSenseVoiceAdapter,
+    )
+
+    if not FUNASR_AVAILABLE:
+        pytest.skip("FunASR 不可用")
+
+    adapter = _setup_adapter(loop, FunASRSenseVoiceAdapter('bench_asr', {
+        'model_dir': str(PROJECT_ROOT / 'outputs/models/asr/SenseVoiceSmall/iic/SenseVoiceSmall'),
+        'device': 'cpu',
+        'sample_rate': SAMPLE_RATE,
+        'channels': 1,
+    }))
+    yield adapter
+    loop.run_until_complete(adapter.close())
+
+
+@pytest.fixture(scope="module")
+def tts_adapter(loop):
+    from backend.adapters.tts.edge_tts_adapter import EDGE_TTS_AVAILABLE, EdgeTTSAdapter
+    from tests.audio_utils import edge_tts_reachable
+
+    if not EDGE_TTS_AVAILABLE:
+        pytest.skip("Edge TTS 不可用")
+    if not edge_tts_reachable():
+        pytest.skip("Edge TTS 服务不可达")
+
+    adapter = _setup_adapter(loop, EdgeTTSAdapter('bench_tts', {
+        'voice': 'zh-CN-XiaoxiaoNeural',
+        'rate': '+0%',
+        'volume': '+0%',
+    }))
+    yield adapter
+    loop.run_until_complete(adapter.close())
+
+
+def test_vad_detect_benchmark(benchmark, loop, vad_adapter):
+    """VAD 单窗口检测耗时"""
+    result = benchmark.pedantic(
+        lambda: loop.run_until_complete(vad_adapter.detect(_VAD_TONE)),
+        rounds=50,
+        warmup_rounds=5,
+    )
+    assert isinstance(result, bool)
+
+
+def test_asr_recognize_benchmark(benchmark, loop, asr_adapter):
+    """ASR 识别 1 秒音频耗时"""
+    from backend.core.models import AudioData, AudioFormat
+
+    audio = AudioData(
+        data=_ASR_SILENCE,
+        format=AudioFormat.PCM,
+        sample_rate=SAMPLE_RATE,
+        channels=1,
+        sample_width=2,
+    )
+    result = benchmark.pedantic(
+        lambda: loop.run_until_complete(asr_adapter.recognize(audio)),
+        rounds=5,
+        warmup_rounds=1,
+    )
+    assert isinstance(result, str)
+
+
+def test_tts_synthesize_benchmark(benchmark, loop, tts_adapter):
+    """TTS 合成短文本耗时"""
+    from backend.core.models import TextData
+
+    async def synthesize() -> int:
+        total_bytes = 0
+        async for chunk in tts_adapter.synthesize_stream(TextData(text=_TTS_TEXT)):
+            if not chunk.is_final:
+                total_bytes += len(chunk.data)
+        return total_bytes
+
+    total_bytes = benchmark.pedantic(
+        lambda: loop.run_until_complete(synthesize()),
+        rounds=3,
+        warmup_rounds=1,
+    )
+    assert total_bytes > 0
@@ -13,9 +13,8 @@ from pathlib import Path
 
 import pytest
 
-# 添加项目根目录到路径
+# 项目根目录（导入路径由 pyproject.toml 的 pytest pythonpath 配置提供）
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 
 class TestRealServer:
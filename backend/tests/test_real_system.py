@@ -11,8 +11,7 @@ import asyncio
 import os
 import sys
 import wave
-import struct
-import math
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -23,25 +22,47 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 os.chdir(PROJECT_ROOT)
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# 测试音频候选路径
+TEST_AUDIO_PATHS = (
+    PROJECT_ROOT / "backend" / "tests" / "fixtures" / "test_audio.wav",
+    PROJECT_ROOT / "outputs" / "test_audio.wav",
+)
+
 
 class SystemTestReporter:
-    """测试结果报告器"""
-    def __init__(self):
+    """测试结果报告器
+
+    buffered=True 时输出先缓存在 lines 中，由 flush() 统一打印（并发运行时使用）。
+    """
+    def __init__(self, buffered: bool = False):
         self.results = []
         self.current_section = None
+        self.buffered = buffered
+        self.lines = []
+
+    def _print(self, line: str):
+        if self.buffered:
+            self.lines.append(line)
+        else:
+            print(line)
+
+    def flush(self):
+        for line in self.lines:
+            print(line)
+        self.lines.clear()
 
     def section(self, name: str):
         self.current_section = name
-        print(f"\n{'='*60}")
-        print(f"  {name}")
-        print(f"{'='*60}")
+        self._print(f"\n{'='*60}")
+        self._print(f"  {name}")
+        self._print(f"{'='*60}")
 
     def test(self, name: str, passed: bool, detail: str = ""):
         status = "✓ PASS" if passed else "✗ FAIL"
         self.results.append((self.current_section, name, passed, detail))
-        print(f"  [{status}] {name}")
+        self._print(f"  [{status}] {name}")
         if detail and not passed:
-            print(f"         {detail}")
+            self._print(f"         {detail}")
 
     def summary(self):
         print(f"\n{'='*60}")
@@ -79,20 +100,27 @@ class SystemTestReporter:
         return failed == 0
 
 
+def _sine_pcm(frequency: float, num_samples: int, sample_rate: int) -> bytes:
+    """用 NumPy 向量化生成 16-bit 小端 PCM 正弦波"""
+    t = np.arange(num_samples, dtype=np.float64) / sample_rate
+    samples = (32767 * 0.5 * np.sin(2 * np.pi * frequency * t)).astype('<i2')
+    return samples.tobytes()
+
+
 def generate_sine_wave(frequency: float, duration: float, sample_rate: int = 16000) -> bytes:
     """生成正弦波音频数据"""
-    num_samples = int(duration * sample_rate)
-    samples = []
-    for i in range(num_samples):
-        sample = int(32767 * 0.5 * math.sin(2 * math.pi * frequency * i / sample_rate))
-        samples.append(struct.pack('<h', sample))
-    return b''.join(samples)
+    return _sine_pcm(frequency, int(duration * sample_rate), sample_rate)
+
+
+@lru_cache(maxsize=16)
+def _silence_pcm(num_samples: int) -> bytes:
+    """生成 16-bit 静音 PCM（按采样数缓存，bytes 不可变可安全复用）"""
+    return bytes(num_samples * 2)
 
 
 def generate_silence(duration: float, sample_rate: int = 16000) -> bytes:
     """生成静音数据"""
-    num_samples = int(duration * sample_rate)
-    return b'\x00\x00' * num_samples
+    return _silence_pcm(int(duration * sample_rate))
 
 
 def generate_vad_chunk(num_samples: int = 512, is_silence: bool = True, sample_rate: int = 16000) -> bytes:
@@ -101,28 +129,25 @@ def generate_vad_chunk(num_samples: int = 512, is_silence: bool = True, sample_r
     Silero VAD 需要精确的 512 采样 (16kHz) 或 256 采样 (8kHz)
     """
     if is_silence:
-        return b'\x00\x00' * num_samples
+        return _silence_pcm(num_samples)
     else:
         # 生成 440Hz 正弦波
-        samples = []
-        for i in range(num_samples):
-            sample = int(32767 * 0.5 * math.sin(2 * math.pi * 440 * i / sample_rate))
-            samples.append(struct.pack('<h', sample))
-        return b''.join(samples)
+        return _sine_pcm(440, num_samples, sample_rate)
+
+
+@lru_cache(maxsize=8)
+def _read_wav_frames(path: Path) -> bytes:
+    """读取 WAV 文件的 PCM 帧（按路径缓存，避免重复读盘）"""
+    with wave.open(str(path), 'rb') as wf:
+        return wf.readframes(wf.getnframes())
 
 
 def load_test_audio() -> bytes:
     """加载或生成测试音频"""
     # 尝试加载真实的测试音频文件
-    test_audio_paths = [
-        PROJECT_ROOT / "backend" / "tests" / "fixtures" / "test_audio.wav",
-        PROJECT_ROOT / "outputs" / "test_audio.wav",
-    ]
-
-    for path in test_audio_paths:
+    for path in TEST_AUDIO_PATHS:
         if path.exists():
-            with wave.open(str(path), 'rb') as wf:
-                return wf.readframes(wf.getnframes())
+            return _read_wav_frames(path)
 
     # 生成模拟音频（440Hz 正弦波 + 静音）
     audio = generate_sine_wave(440, 0.5)  # 0.5秒 440Hz
@@ -218,14 +243,17 @@ async def test_tts_module(reporter: SystemTestReporter):
 
         # 测试语音合成
         text = TextData(text="你好")
-        chunks = []
+        # 单次遍历统计块数和音频字节数
+        chunk_count = 0
+        total_bytes = 0
         async for chunk in adapter.synthesize_stream(text):
-            chunks.append(chunk)
+            chunk_count += 1
+            if not chunk.is_final:
+                total_bytes += len(chunk.data)
 
-        reporter.test("TTS 语音合成", len(chunks) > 0, f"生成 {len(chunks)} 个音频块")
+        reporter.test("TTS 语音合成", chunk_count > 0, f"生成 {chunk_count} 个音频块")
 
         # 验证音频数据
-        total_bytes = sum(len(c.data) for c in chunks if not c.is_final)
         reporter.test("TTS 音频数据有效", total_bytes > 0, f"总共 {total_bytes} 字节")
 
         # 测试空文本处理
@@ -325,10 +353,11 @@ async def test_llm_module(reporter: SystemTestReporter):
 
         # 测试对话
         text = TextData(text="测试")
-        response = ""
+        response_parts = []
         async for chunk in adapter.chat_stream(text, "test_session"):
             if chunk.text:
-                response += chunk.text
+                response_parts.append(chunk.text)
+        response = "".join(response_parts)
 
         reporter.test("LLM 对话生成", len(response) > 0, f"响应长度: {len(response)}")
 
@@ -453,20 +482,21 @@ async def test_llm_tts_combination(reporter: SystemTestReporter):
 
         # LLM 生成文本
         input_text = TextData(text="你好")
-        llm_response = ""
+        llm_response_parts = []
         async for chunk in llm.chat_stream(input_text, "combo_session"):
             if chunk.text:
-                llm_response += chunk.text
+                llm_response_parts.append(chunk.text)
+        llm_response = "".join(llm_response_parts)
 
         reporter.test("LLM 生成响应", len(llm_response) > 0, f"响应: {llm_response[:50]}")
 
         # TTS 合成语音
         tts_input = TextData(text=llm_response)
-        audio_chunks = []
+        total_audio = 0
         async for chunk in tts.synthesize_stream(tts_input):
-            audio_chunks.append(chunk)
+            if not chunk.is_final:
+                total_audio += len(chunk.data)
 
-        total_audio = sum(len(c.data) for c in audio_chunks if not c.is_final)
         reporter.test("TTS 合成音频", total_audio > 0, f"音频大小: {total_audio} 字节")
 
         # 清理
@@ -565,20 +595,21 @@ async def test_full_pipeline(reporter: SystemTestReporter):
 
         # 步骤 4: LLM 生成（使用固定文本测试）
         llm_input = TextData(text="你好")
-        llm_response = ""
+        llm_response_parts = []
         async for chunk in llm.chat_stream(llm_input, "pipeline_session"):
             if chunk.text:
-                llm_response += chunk.text
+                llm_response_parts.append(chunk.text)
+        llm_response = "".join(llm_response_parts)
         reporter.test("步骤4: LLM 生成", len(llm_response) > 0, f"响应: {llm_response[:30]}...")
 
         # 步骤 5: TTS 合成
         tts_input = TextData(text=llm_response)
-        audio_output = []
+        audio_output = bytearray()
         async for chunk in tts.synthesize_stream(tts_input):
             if not chunk.is_final:
-                audio_output.append(chunk.data)
+                audio_output.extend(chunk.data)
 
-        total_audio_size = sum(len(a) for a in audio_output)
+        total_audio_size = len(audio_output)
         reporter.test("步骤5: TTS 合成", total_audio_size > 0, f"音频大小: {total_audio_size} 字节")
 
         # 完整流水线成功
@@ -649,6 +680,25 @@ async def test_chat_engine(reporter: SystemTestReporter):
         reporter.test("ChatEngine 测试", False, str(e))
 
 
+async def run_concurrently(reporter: SystemTestReporter, *tests) -> None:
+    """并发运行互不依赖的测试
+
+    每个测试使用独立的缓冲报告器，避免并发时 section 和输出交错，
+    全部完成后按传入顺序打印输出并合并结果到主报告器。
+    某个测试抛出未处理的异常时记为失败，不影响其他测试的输出和结果。
+    """
+    reporters = [SystemTestReporter(buffered=True) for _ in tests]
+    outcomes = await asyncio.gather(
+        *(test(r) for test, r in zip(tests, reporters, strict=True)),
+        return_exceptions=True,
+    )
+    for test, r, outcome in zip(tests, reporters, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            r.test(test.__name__, False, f"未处理的异常: {outcome!r}")
+        r.flush()
+        reporter.results.extend(r.results)
+
+
 async def main():
     """运行所有测试"""
     print("\n" + "="*60)
@@ -669,15 +719,21 @@ async def main():
 
     reporter = SystemTestReporter()
 
-    # 1. 单模块测试
-    await test_vad_module(reporter)
-    await test_asr_module(reporter)
-    await test_tts_module(reporter)
-    await test_llm_module(reporter)
+    # 1. 单模块测试（互不依赖，并发执行）
+    await run_concurrently(
+        reporter,
+        test_vad_module,
+        test_asr_module,
+        test_tts_module,
+        test_llm_module,
+    )
 
     # 2. 组合测试
-    await test_vad_asr_combination(reporter)
-    await test_llm_tts_combination(reporter)
+    await run_concurrently(
+        reporter,
+        test_vad_asr_combination,
+        test_llm_tts_combination,
+    )
 
     # 3. 端到端测试
     await test_full_pipeline(reporter)
@@ -1,13 +1,9 @@
 import asyncio
 import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 import pytest
 import numpy as np
 
-# 添加项目根目录到系统路径
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 from backend.core.models.audio_data import AudioData, AudioFormat
 from backend.core.models.exceptions import ModuleInitializationError, ModuleProcessingError
 from backend.adapters.asr.funasr_sensevoice_adapter import FunASRSenseVoiceAdapter, FUNASR_AVAILABLE
@@ -130,6 +130,23 @@ class TestBaseProtocol:
         await protocol.handle_text_message(mock_connection, stream_end_event.model_dump_json())
         mock_handler.handle_speech_end.assert_called_once()
 
+    @pytest.mark.parametrize("event_type, handler_name", [
+        (EventType.CONFIG_GET, "_handle_config_get"),
+        (EventType.CONFIG_SET, "_handle_config_set"),
+        (EventType.MODULE_STATUS_GET, "_handle_module_status_get"),
+        (EventType.CLIENT_SPEECH_END, "_route_message"),
+    ])
+    async def test_handle_text_message_dispatch(self, protocol, mock_connection, event_type, handler_name):
+        """测试按事件类型分发到对应处理方法"""
+        event = StreamEvent(event_type=event_type, session_id="session_1")
+
+        with patch.object(protocol, handler_name, new_callable=AsyncMock) as mock_handler:
+            await protocol.handle_text_message(mock_connection, event.model_dump_json())
+
+        mock_handler.assert_called_once()
+        assert mock_handler.call_args[0][0] is mock_connection
+        assert mock_handler.call_args[0][1].event_type == event_type
+
     async def test_handle_invalid_message(self, protocol, mock_connection):
         """测试无效消息处理"""
         # 非 JSON 消息
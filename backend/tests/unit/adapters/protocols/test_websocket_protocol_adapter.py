@@ -63,7 +63,14 @@ class TestWebSocketProtocolAdapter:
             start_task = asyncio.create_task(adapter.start())
             await asyncio.sleep(0.1) # 让 start 运行到 wait_closed
 
-            mock_serve.assert_called_once_with(ANY, "localhost", 8765)
+            mock_serve.assert_called_once_with(
+                ANY, "localhost", 8765,
+                compression=None,
+                max_size=2 ** 20,
+                max_queue=16,
+                ping_interval=20,
+                ping_timeout=20,
+            )
             assert adapter.server == mock_server
 
             # 测试停止
@@ -73,6 +80,30 @@ class TestWebSocketProtocolAdapter:
 
             await start_task
 
+    async def test_server_options_from_config(self, mock_conversation_manager):
+        """测试连接参数从配置读取"""
+        config = {
+            "websocket_max_message_size": 2097152,
+            "compression": "deflate",
+            "max_queue": 64,
+            "ping_interval": None,
+            "ping_timeout": None,
+        }
+        adapter = WebSocketProtocolAdapter("ws", config, mock_conversation_manager)
+
+        with patch('websockets.serve', new_callable=AsyncMock) as mock_serve:
+            mock_serve.return_value = AsyncMock()
+            await adapter.start()
+
+        mock_serve.assert_called_once_with(
+            ANY, "0.0.0.0", 8765,
+            compression="deflate",
+            max_size=2097152,
+            max_queue=64,
+            ping_interval=None,
+            ping_timeout=None,
+        )
+
     async def test_session_management(self, adapter, mock_websocket):
         """测试会话管理"""
         tag_id = "user123"
@@ -276,3 +276,55 @@ async def test_metadata_integrity(adapter, mock_edge_tts_available):
     assert last_chunk.metadata["status"] == "complete"
     assert "total_chunks" in last_chunk.metadata
     assert isinstance(last_chunk.metadata["total_chunks"], int)
+
+
+@pytest.mark.asyncio
+async def test_synthesize_stream_saves_audio(mock_edge_tts_available, adapter_config, tmp_path):
+    """测试开启保存时音频块边合成边写入文件"""
+    adapter = EdgeTTSAdapter(
+        "test_edge_tts_save",
+        {**adapter_config, "save_generated_audio": True, "audio_save_path": str(tmp_path)}
+    )
+    adapter._is_ready = True
+
+    mock_communicate = MagicMock()
+    async def mock_stream():
+        yield {"type": "audio", "data": b"chunk1"}
+        yield {"type": "audio", "data": b"chunk2"}
+
+    mock_communicate.stream.return_value = mock_stream()
+    mock_edge_tts_available.Communicate.return_value = mock_communicate
+
+    chunks = []
+    async for chunk in adapter.synthesize_stream(TextData(text="保存测试")):
+        chunks.append(chunk)
+
+    saved_path = chunks[-1].metadata["saved_path"]
+    assert saved_path is not None
+    with open(saved_path, "rb") as f:
+        assert f.read() == b"chunk1chunk2"
+
+
+@pytest.mark.asyncio
+async def test_synthesize_stream_failure_removes_partial_audio(mock_edge_tts_available, adapter_config, tmp_path):
+    """测试合成中断时删除不完整的音频文件"""
+    adapter = EdgeTTSAdapter(
+        "test_edge_tts_save_fail",
+        {**adapter_config, "save_generated_audio": True, "audio_save_path": str(tmp_path)}
+    )
+    adapter._is_ready = True
+    adapter.max_retries = 1
+
+    mock_communicate = MagicMock()
+    async def broken_stream():
+        yield {"type": "audio", "data": b"chunk1"}
+        raise Exception("Connection lost")
+
+    mock_communicate.stream.return_value = broken_stream()
+    mock_edge_tts_available.Communicate.return_value = mock_communicate
+
+    with pytest.raises(ModuleProcessingError):
+        async for _ in adapter.synthesize_stream(TextData(text="中断测试")):
+            pass
+
+    assert list(tmp_path.iterdir()) == []
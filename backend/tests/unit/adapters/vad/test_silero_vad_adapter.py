@@ -65,6 +65,15 @@ class TestSileroVADAdapter:
         assert adapter.max_consecutive_failures == 3
         assert adapter.model is None
 
+    def test_initialization_auto_device(self, vad_config):
+        """测试 device=auto 时自动选择设备"""
+        vad_config["device"] = "auto"
+        with patch("backend.adapters.vad.silero_vad_adapter.resolve_device", return_value="cuda") as mock_resolve:
+            adapter = SileroVADAdapter("test_vad", vad_config)
+
+        mock_resolve.assert_called_once_with("auto")
+        assert adapter.device == "cuda"
+
     @pytest.mark.asyncio
     async def test_setup_success(self, vad_adapter):
         """测试模型成功加载"""
@@ -160,6 +169,7 @@ class TestSileroVADAdapter:
 
             assert result is True
             assert vad_adapter.consecutive_failures == 0
+            assert vad_adapter.last_speech_prob == 0.8
 
     @pytest.mark.asyncio
     async def test_detect_no_speech(self, vad_adapter):
@@ -188,6 +198,7 @@ class TestSileroVADAdapter:
             result = await vad_adapter.detect(audio_data)
 
             assert result is False
+            assert vad_adapter.last_speech_prob == 0.2
 
     @pytest.mark.asyncio
     async def test_consecutive_failures(self, vad_adapter):
@@ -176,6 +176,20 @@ class TestAudioInputHandler:
         event = mock_callback.call_args[0][0]
         assert event.event_data.is_final is True
 
+    @pytest.mark.asyncio
+    async def test_monitor_loop_handles_client_speech_end(self, audio_handler, mock_asr_module):
+        """Test monitor loop wakes up on client speech end and clears the event"""
+        async with audio_handler.buffer_lock:
+            audio_handler.audio_buffer.append(b"data")
+
+        audio_handler.start()
+        audio_handler.signal_client_speech_end()
+        await asyncio.sleep(0.05)
+        await audio_handler.stop()
+
+        mock_asr_module.recognize.assert_called_once()
+        assert not audio_handler.client_speech_ended.is_set()
+
     @pytest.mark.asyncio
     async def test_asr_processing_and_cleaning(self, audio_handler, mock_asr_module):
         """Test ASR processing and text cleaning"""
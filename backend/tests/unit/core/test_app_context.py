@@ -6,14 +6,6 @@ from backend.core.app_context import AppContext
 class TestAppContext:
     """AppContext 测试类"""
 
-    def setup_method(self):
-        """每个测试前清空 AppContext"""
-        AppContext.clear()
-
-    def teardown_method(self):
-        """每个测试后清空 AppContext"""
-        AppContext.clear()
-
     def test_set_and_get_modules(self):
         """测试设置和获取模块"""
         # 模拟模块
@@ -60,3 +52,25 @@ class TestAppContext:
         # 覆盖
         AppContext.set_modules({"llm": "version2"})
         assert AppContext.get_module("llm") == "version2"
+
+    def test_scope_restores_previous_modules(self):
+        """测试作用域退出后恢复之前的模块"""
+        AppContext.set_modules({"llm": "outer_llm"})
+
+        with AppContext.scope({"llm": "inner_llm"}):
+            assert AppContext.get_module("llm") == "inner_llm"
+            AppContext.clear()
+            assert AppContext.get_module("llm") is None
+
+        assert AppContext.get_module("llm") == "outer_llm"
+
+    def test_scope_restores_on_exception(self):
+        """测试作用域内抛出异常时也会恢复模块"""
+        AppContext.set_modules({"llm": "outer_llm"})
+
+        with pytest.raises(RuntimeError):
+            with AppContext.scope():
+                assert AppContext.get_module("llm") is None
+                raise RuntimeError("boom")
+
+        assert AppContext.get_module("llm") == "outer_llm"
@@ -4,16 +4,14 @@ from backend.core.session.session_context import SessionContext
 from backend.core.app_context import AppContext
 
 
-class TestSessionContext:
-    """SessionContext 测试类"""
+@pytest.fixture
+def ctx():
+    """使用默认参数构造的会话上下文（AppContext 由 conftest 的自动 fixture 隔离）"""
+    return SessionContext(session_id="test_session", tag_id="test_tag")
 
-    def setup_method(self):
-        """每个测试前清空 AppContext"""
-        AppContext.clear()
 
-    def teardown_method(self):
-        """每个测试后清空 AppContext"""
-        AppContext.clear()
+class TestSessionContext:
+    """SessionContext 测试类"""
 
     def test_create_session_context(self):
         """测试创建会话上下文"""
@@ -28,7 +26,7 @@ class TestSessionContext:
         assert ctx.config == {}
         assert ctx.custom_modules == {}
 
-    def test_get_module_from_module_provider(self):
+    def test_get_module_from_module_provider(self, ctx):
         """测试从模块提供者获取模块"""
         # 设置全局模块
         AppContext.set_modules({
@@ -36,10 +34,6 @@ class TestSessionContext:
             "tts": "global_tts"
         })
 
-        ctx = SessionContext(
-            session_id="test_session",
-            tag_id="test_tag"
-        )
         # 注入模块提供者
         ctx.set_module_provider(AppContext.get_module)
 
@@ -64,13 +58,8 @@ class TestSessionContext:
         # 应该返回自定义模块（优先于提供者）
         assert ctx.get_module("llm") == "custom_llm"
 
-    def test_get_nonexistent_module(self):
+    def test_get_nonexistent_module(self, ctx):
         """测试获取不存在的模块"""
-        ctx = SessionContext(
-            session_id="test_session",
-            tag_id="test_tag"
-        )
-
         # 不存在的模块应返回 None
         assert ctx.get_module("nonexistent") is None
 
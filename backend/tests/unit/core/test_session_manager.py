@@ -41,41 +41,56 @@ class TestInMemoryStorage:
         assert storage.get("s2") is not None
         assert storage.get("s3") is not None
 
+    def test_lru_get_refreshes_recency(self):
+        """测试 get 会刷新最近使用顺序"""
+        storage = InMemoryStorage(maxsize=2)
+
+        storage.set("s1", SessionContext(session_id="s1", tag_id="u1"))
+        storage.set("s2", SessionContext(session_id="s2", tag_id="u2"))
+        storage.get("s1")  # s1 变为最近使用
+        storage.set("s3", SessionContext(session_id="s3", tag_id="u3"))  # 应该淘汰 s2
+
+        assert storage.get("s1") is not None
+        assert storage.get("s2") is None
+        assert storage.get("s3") is not None
+
+    def test_set_existing_key_does_not_evict(self):
+        """测试更新已有 key 不会触发淘汰"""
+        storage = InMemoryStorage(maxsize=2)
+
+        storage.set("s1", SessionContext(session_id="s1", tag_id="u1"))
+        storage.set("s2", SessionContext(session_id="s2", tag_id="u2"))
+        storage.set("s1", SessionContext(session_id="s1", tag_id="u1b"))
+
+        assert storage.get("s1").tag_id == "u1b"
+        assert storage.get("s2") is not None
+
 
 @pytest.mark.asyncio
 class TestSessionManager:
-    """SessionManager 测试类"""
+    """SessionManager 测试类（使用 conftest 中共享的 session_manager fixture）"""
 
-    async def test_create_session(self):
+    async def test_create_session(self, session_manager):
         """测试创建会话"""
-        storage = InMemoryStorage()
-        manager = SessionManager(storage_backend=storage)
-
         ctx = SessionContext(session_id="test_session", tag_id="test_user")
-        result = await manager.create_session(ctx)
+        result = await session_manager.create_session(ctx)
 
         assert result.session_id == "test_session"
         assert result.tag_id == "test_user"
 
-    async def test_get_session(self):
+    async def test_get_session(self, session_manager):
         """测试获取会话"""
-        storage = InMemoryStorage()
-        manager = SessionManager(storage_backend=storage)
-
         ctx = SessionContext(session_id="test_session", tag_id="test_user")
-        await manager.create_session(ctx)
+        await session_manager.create_session(ctx)
 
         # 获取会话
-        result = await manager.get_session("test_session")
+        result = await session_manager.get_session("test_session")
         assert result is not None
         assert result.session_id == "test_session"
 
-    async def test_get_nonexistent_session(self):
+    async def test_get_nonexistent_session(self, session_manager):
         """测试获取不存在的会话"""
-        storage = InMemoryStorage()
-        manager = SessionManager(storage_backend=storage)
-
-        result = await manager.get_session("nonexistent")
+        result = await session_manager.get_session("nonexistent")
         assert result is None
 
     async def test_close(self):
@@ -1,10 +1,20 @@
 """audio_converter 单元测试"""
+import sys
+
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
 from backend.core.models import AudioData, AudioFormat
 
 
+@pytest.fixture
+def without_mock_torch():
+    """其他测试模块会把 torch 替换为 MagicMock，scipy 检测到后会出错，这里临时移除"""
+    with patch.dict(sys.modules):
+        sys.modules.pop("torch", None)
+        yield
+
+
 class TestConvertAudioFormat:
     """convert_audio_format 测试类"""
 
@@ -102,3 +112,233 @@ class TestConvertAudioFormat:
         finally:
             audio_converter.TORCHAUDIO_AVAILABLE = original_torchaudio
             audio_converter.PYDUB_AVAILABLE = original_pydub
+
+    @pytest.mark.usefixtures("without_mock_torch")
+    def test_soundfile_decodes_wav_in_process(self):
+        """测试 soundfile 直接解码 WAV 并完成重采样和单声道转换"""
+        import io
+        import backend.utils.audio_converter as audio_converter
+
+        sf = pytest.importorskip("soundfile")
+
+        # 0.5 秒 44.1kHz 立体声 440Hz 正弦波
+        t = np.arange(22050) / 44100
+        tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        buf = io.BytesIO()
+        sf.write(buf, np.stack([tone, tone], axis=1), 44100, format="WAV", subtype="PCM_16")
+
+        audio = AudioData(
+            data=buf.getvalue(),
+            format=AudioFormat.WAV,
+            sample_rate=44100,
+            channels=2,
+            sample_width=2
+        )
+
+        with patch.object(audio_converter, "convert_audio_format_torchaudio") as mock_torchaudio, \
+                patch.object(audio_converter, "_convert_with_pydub") as mock_pydub:
+            result = audio_converter.convert_audio_format(
+                audio=audio,
+                sample_rate=16000,
+                channels=1,
+                sample_width=2,
+            )
+
+        mock_torchaudio.assert_not_called()
+        mock_pydub.assert_not_called()
+        assert result.dtype == np.float32
+        assert result.shape == (8000,)
+
+    @pytest.mark.usefixtures("without_mock_torch")
+    def test_soundfile_decodes_opus_in_process(self):
+        """测试 Ogg Opus 也由 soundfile 在进程内解码，不经过 pydub 的 ffmpeg 子进程"""
+        import io
+        import backend.utils.audio_converter as audio_converter
+
+        sf = pytest.importorskip("soundfile")
+
+        # 0.5 秒 48kHz 单声道 440Hz 正弦波
+        t = np.arange(24000) / 48000
+        tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        buf = io.BytesIO()
+        try:
+            sf.write(buf, tone, 48000, format="OGG", subtype="OPUS")
+        except (sf.LibsndfileError, ValueError):
+            pytest.skip("libsndfile 不支持 Opus")
+
+        audio = AudioData(
+            data=buf.getvalue(),
+            format=AudioFormat.OPUS,
+            sample_rate=48000,
+            channels=1,
+            sample_width=2
+        )
+
+        with patch.object(audio_converter, "convert_audio_format_torchaudio") as mock_torchaudio, \
+                patch.object(audio_converter, "_convert_with_pydub") as mock_pydub:
+            result = audio_converter.convert_audio_format(
+                audio=audio,
+                sample_rate=16000,
+                channels=1,
+                sample_width=2,
+            )
+
+        mock_torchaudio.assert_not_called()
+        mock_pydub.assert_not_called()
+        assert result.dtype == np.float32
+        assert abs(len(result) - 8000) < 400
+
+    def test_soundfile_int16_output(self):
+        """测试 soundfile 分支输出 int16"""
+        import io
+        import backend.utils.audio_converter as audio_converter
+
+        sf = pytest.importorskip("soundfile")
+
+        buf = io.BytesIO()
+        sf.write(buf, np.zeros(1600, dtype=np.float32), 16000, format="WAV", subtype="PCM_16")
+        audio = AudioData(
+            data=buf.getvalue(),
+            format=AudioFormat.WAV,
+            sample_rate=16000,
+            channels=1,
+            sample_width=2
+        )
+
+        result = audio_converter.convert_audio_format_soundfile(
+            audio, sample_rate=16000, channels=1, output_format="pcm_s16le"
+        )
+        assert result.dtype == np.int16
+        assert result.shape == (1600,)
+
+    @pytest.mark.usefixtures("without_mock_torch")
+    def test_pcm_converted_without_pydub(self):
+        """测试原始 PCM 直接用 NumPy 完成重采样和单声道转换"""
+        import backend.utils.audio_converter as audio_converter
+
+        # 0.5 秒 48kHz 立体声 int16 PCM
+        t = np.arange(24000) / 48000
+        tone = (0.5 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        audio = AudioData(
+            data=np.stack([tone, tone], axis=1).tobytes(),
+            format=AudioFormat.PCM,
+            sample_rate=48000,
+            channels=2,
+            sample_width=2
+        )
+
+        with patch.object(audio_converter, "convert_audio_format_torchaudio") as mock_torchaudio, \
+                patch.object(audio_converter, "_convert_with_pydub") as mock_pydub:
+            result = audio_converter.convert_audio_format(
+                audio=audio,
+                sample_rate=16000,
+                channels=1,
+                sample_width=2,
+            )
+
+        mock_torchaudio.assert_not_called()
+        mock_pydub.assert_not_called()
+        assert result.dtype == np.float32
+        assert result.shape == (8000,)
+        assert np.abs(result).max() <= 1.0
+
+    @pytest.mark.usefixtures("without_mock_torch")
+    def test_pcm_stereo_round_trip_interleaved(self):
+        """测试立体声 PCM 重采样后仍输出交错样本，并按目标样本宽度输出 int16"""
+        import backend.utils.audio_converter as audio_converter
+
+        # 0.5 秒 48kHz 立体声，左右声道幅度不同，便于检查交错顺序
+        t = np.arange(24000) / 48000
+        left = (0.5 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        right = (0.25 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        audio = AudioData(
+            data=np.stack([left, right], axis=1).tobytes(),
+            format=AudioFormat.PCM,
+            sample_rate=48000,
+            channels=2,
+            sample_width=2
+        )
+
+        result = audio_converter.convert_audio_format_pcm(
+            audio, sample_rate=16000, channels=2, sample_width=2, output_format="pcm_s16le"
+        )
+
+        assert result.dtype == np.int16
+        assert result.shape == (16000,)
+        frames = result.reshape(-1, 2)
+        assert np.abs(frames[:, 0]).max() > 1.5 * np.abs(frames[:, 1]).max()
+
+        # 目标样本宽度不是 16 位时，与 pydub 分支一样拒绝 pcm_s16le
+        assert audio_converter.convert_audio_format_pcm(
+            audio, sample_rate=16000, channels=2, sample_width=4, output_format="pcm_s16le"
+        ) is None
+
+    @pytest.mark.parametrize("output_format, expected_dtype", [
+        ("pcm_f32le", np.float32),
+        ("pcm_s16le", np.int16),
+    ])
+    @pytest.mark.usefixtures("without_mock_torch")
+    def test_matching_pcm_skips_resampling(self, output_format, expected_dtype):
+        """测试 PCM 与目标格式一致时直接转换，不经过重采样和其他后端"""
+        import backend.utils.audio_converter as audio_converter
+
+        tone = (0.5 * 32767 * np.sin(2 * np.pi * 440 * np.arange(8000) / 16000)).astype(np.int16)
+        audio = AudioData(
+            data=tone.tobytes(),
+            format=AudioFormat.PCM,
+            sample_rate=16000,
+            channels=1,
+            sample_width=2
+        )
+
+        with patch.object(audio_converter, "convert_audio_format_pcm") as mock_pcm, \
+                patch.object(audio_converter, "_convert_with_pydub") as mock_pydub:
+            result = audio_converter.convert_audio_format(
+                audio=audio,
+                sample_rate=16000,
+                channels=1,
+                sample_width=2,
+                output_format=output_format,
+            )
+
+        mock_pcm.assert_not_called()
+        mock_pydub.assert_not_called()
+        assert result.dtype == expected_dtype
+        assert result.shape == (8000,)
+
+    @pytest.mark.usefixtures("without_mock_torch")
+    def test_resample_filter_matches_scipy_default(self):
+        """测试缓存的重采样滤波器与 resample_poly 默认设计结果一致"""
+        from scipy import signal
+        import backend.utils.audio_converter as audio_converter
+
+        x = np.random.default_rng(0).standard_normal(4410).astype(np.float32)
+        audio_converter._get_resample_filter.cache_clear()
+        try:
+            result = audio_converter._resample(x, 44100, 16000)
+            audio_converter._resample(x, 44100, 16000)
+            expected = signal.resample_poly(x.astype(np.float64), 160, 441)
+            info = audio_converter._get_resample_filter.cache_info()
+        finally:
+            audio_converter._get_resample_filter.cache_clear()
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+        assert info.hits == 1 and info.misses == 1
+
+    def test_torchaudio_resampler_is_cached(self):
+        """测试 torchaudio 重采样器按采样率对缓存复用"""
+        import backend.utils.audio_converter as audio_converter
+
+        mock_torchaudio = MagicMock()
+        audio_converter._get_torchaudio_resampler.cache_clear()
+        try:
+            with patch.object(audio_converter, "torchaudio", mock_torchaudio, create=True):
+                first = audio_converter._get_torchaudio_resampler(48000, 16000)
+                second = audio_converter._get_torchaudio_resampler(48000, 16000)
+                audio_converter._get_torchaudio_resampler(44100, 16000)
+        finally:
+            audio_converter._get_torchaudio_resampler.cache_clear()
+
+        assert first is second
+        assert mock_torchaudio.transforms.Resample.call_count == 2
@@ -0,0 +1,73 @@
+"""StreamEvent 序列化单元测试"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import backend.core.models.stream_event as stream_event_module
+from backend.core.models import AudioData, AudioFormat, EventType, StreamEvent, TextData
+
+
+EVENTS = [
+    StreamEvent(
+        event_type=EventType.SERVER_TEXT_RESPONSE,
+        event_data=TextData(text="你好，世界", is_final=True),
+        session_id="session_1",
+        tag_id="tag_1",
+    ),
+    StreamEvent(
+        event_type=EventType.SERVER_AUDIO_RESPONSE,
+        event_data=AudioData(data=b"\x00\x01\x02\x03", format=AudioFormat.PCM),
+        session_id="session_1",
+    ),
+    StreamEvent(
+        event_type=EventType.CONFIG_SNAPSHOT,
+        event_data={"llm": {"temperature": 0.7, "max_tokens": 1024}, "ids": [1, 2, 3]},
+    ),
+    StreamEvent(
+        event_type=EventType.MODULE_STATUS_REPORT,
+        event_data={"asr": {"status": "running", "error": "未加载"}},
+    ),
+    StreamEvent(
+        event_type=EventType.CONFIG_SNAPSHOT,
+        event_data={"big": 2 ** 70},
+    ),
+]
+
+
+class TestStreamEventJson:
+    """测试 orjson 与标准库 json 两条路径输出一致"""
+
+    @pytest.mark.parametrize("event", EVENTS)
+    def test_to_json_parity(self, event):
+        """测试两条序列化路径得到相同的 JSON 内容"""
+        pytest.importorskip("orjson")
+
+        with patch.object(stream_event_module, "ORJSON_AVAILABLE", True):
+            fast = event.to_json()
+        with patch.object(stream_event_module, "ORJSON_AVAILABLE", False):
+            stdlib = event.to_json()
+
+        assert json.loads(fast) == json.loads(stdlib)
+
+    @pytest.mark.parametrize("event", EVENTS)
+    def test_from_json_parity(self, event):
+        """测试两条反序列化路径得到相同的事件"""
+        pytest.importorskip("orjson")
+
+        payload = event.to_json()
+        with patch.object(stream_event_module, "ORJSON_AVAILABLE", True):
+            fast = StreamEvent.from_json(payload)
+        with patch.object(stream_event_module, "ORJSON_AVAILABLE", False):
+            stdlib = StreamEvent.from_json(payload)
+
+        assert fast == stdlib
+
+    def test_from_json_accepts_nan_like_stdlib(self):
+        """测试 orjson 拒绝的 NaN 由标准库解析"""
+        payload = '{"event_type": "CONFIG_SNAPSHOT", "event_data": {"value": NaN}}'
+
+        event = StreamEvent.from_json(payload)
+
+        assert event.event_data["value"] != event.event_data["value"]
@@ -57,6 +57,49 @@ async def test_load_config_unknown_error():
         assert "未知错误" in str(excinfo.value)
 
 
+@pytest.mark.asyncio
+async def test_load_config_cached_until_modified(tmp_path):
+    """测试配置按修改时间缓存，返回值互不影响"""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("app:\n  name: first\n", encoding="utf-8")
+
+    config = await ConfigLoader.load_config(str(config_file))
+    config["app"]["name"] = "mutated"
+
+    with patch("aiofiles.open") as mock_aio_open:
+        cached = await ConfigLoader.load_config(str(config_file))
+    mock_aio_open.assert_not_called()
+    assert cached == {"app": {"name": "first"}}
+
+    config_file.write_text("app:\n  name: second\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = await ConfigLoader.load_config(str(config_file))
+    assert reloaded == {"app": {"name": "second"}}
+
+
+@pytest.mark.asyncio
+async def test_load_config_reloaded_when_size_changes_within_mtime_tick(tmp_path):
+    """测试同一修改时间内重写文件（大小不同）时重新解析，且每个路径只缓存一份"""
+    from backend.utils.config_loader import _CONFIG_CACHE
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("app:\n  name: first\n", encoding="utf-8")
+    mtime_ns = config_file.stat().st_mtime_ns
+
+    assert await ConfigLoader.load_config(str(config_file)) == {"app": {"name": "first"}}
+    cache_size = len(_CONFIG_CACHE)
+
+    config_file.write_text("app:\n  name: second-save\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, mtime_ns))
+
+    reloaded = await ConfigLoader.load_config(str(config_file))
+    assert reloaded == {"app": {"name": "second-save"}}
+    assert len(_CONFIG_CACHE) == cache_size
+    assert _CONFIG_CACHE[os.path.abspath(config_file)][0] == mtime_ns
+
 # Test ConfigLoader.resolve_env_vars
 
 def test_resolve_env_vars_no_env():
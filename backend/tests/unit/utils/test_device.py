@@ -0,0 +1,41 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+from backend.utils.device import resolve_device
+
+
+def _mock_torch(cuda: bool, mps: bool) -> MagicMock:
+    torch = MagicMock()
+    torch.cuda.is_available.return_value = cuda
+    torch.backends.mps.is_available.return_value = mps
+    return torch
+
+
+def test_explicit_device_is_kept():
+    """测试显式指定的设备原样返回"""
+    assert resolve_device("cpu") == "cpu"
+    assert resolve_device("cuda") == "cuda"
+
+
+def test_auto_prefers_cuda():
+    """测试 auto 优先选择 CUDA"""
+    with patch.dict(sys.modules, {"torch": _mock_torch(cuda=True, mps=True)}):
+        assert resolve_device("auto") == "cuda"
+
+
+def test_auto_falls_back_to_mps():
+    """测试没有 CUDA 时选择 MPS"""
+    with patch.dict(sys.modules, {"torch": _mock_torch(cuda=False, mps=True)}):
+        assert resolve_device("auto") == "mps"
+
+
+def test_auto_falls_back_to_cpu():
+    """测试没有加速设备时回退到 CPU"""
+    with patch.dict(sys.modules, {"torch": _mock_torch(cuda=False, mps=False)}):
+        assert resolve_device("auto") == "cpu"
+
+
+def test_auto_without_torch():
+    """测试未安装 torch 时回退到 CPU"""
+    with patch.dict(sys.modules, {"torch": None}):
+        assert resolve_device("auto") == "cpu"
@@ -0,0 +1,20 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from backend.utils import event_loop
+from backend.utils.event_loop import get_loop_factory
+
+
+def test_loop_factory_without_uvloop():
+    """测试未安装 uvloop 时使用默认事件循环"""
+    with patch.object(event_loop, "UVLOOP_AVAILABLE", False):
+        assert get_loop_factory() is None
+        assert asyncio.run(asyncio.sleep(0, result="ok"), loop_factory=get_loop_factory()) == "ok"
+
+
+def test_loop_factory_with_uvloop():
+    """测试安装 uvloop 时返回其事件循环工厂"""
+    mock_uvloop = MagicMock()
+    with patch.object(event_loop, "UVLOOP_AVAILABLE", True), \
+            patch.object(event_loop, "uvloop", mock_uvloop):
+        assert get_loop_factory() is mock_uvloop.new_event_loop
@@ -1,4 +1,6 @@
 import io
+import math
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -28,7 +30,7 @@ def apply_noise_reduction(audio_np: np.ndarray, sample_rate: int) -> np.ndarray:
 
     # 转换为 float64 进行处理
     if audio_np.dtype == np.int16:
-        audio_float = audio_np.astype(np.float64) / 32768.0
+        audio_float = np.divide(audio_np, 32768.0, dtype=np.float64)
     elif audio_np.dtype in [np.float32, np.float64]:
         audio_float = audio_np.astype(np.float64)
     else:
@@ -42,7 +44,7 @@ def apply_noise_reduction(audio_np: np.ndarray, sample_rate: int) -> np.ndarray:
             b, a = signal.butter(2, high_cutoff, btype='high')
             audio_float = signal.filtfilt(b, a, audio_float)
     except Exception as e:
-        logger.debug(f"高通滤波器应用失败: {e}")
+        logger.debug("高通滤波器应用失败: %s", e)
 
     # 2. 低通滤波器 - 移除高频噪声
     try:
@@ -51,7 +53,7 @@ def apply_noise_reduction(audio_np: np.ndarray, sample_rate: int) -> np.ndarray:
             b, a = signal.butter(2, low_cutoff, btype='low')
             audio_float = signal.filtfilt(b, a, audio_float)
     except Exception as e:
-        logger.debug(f"低通滤波器应用失败: {e}")
+        logger.debug("低通滤波器应用失败: %s", e)
 
     # 3. 简单噪声门控 - 抑制低能量片段
     try:
@@ -66,7 +68,7 @@ def apply_noise_reduction(audio_np: np.ndarray, sample_rate: int) -> np.ndarray:
             mask_smooth = np.convolve(mask_float, kernel, mode='same')
             audio_float = audio_float * np.clip(mask_smooth, 0.1, 1.0)  # 保留至少 10%
     except Exception as e:
-        logger.debug(f"噪声门控应用失败: {e}")
+        logger.debug("噪声门控应用失败: %s", e)
 
     # 转换回原始类型
     if original_dtype == np.int16:
@@ -93,6 +95,172 @@ try:
 except ImportError:
     TORCHAUDIO_AVAILABLE = False
 
+# 尝试导入 soundfile（libsndfile 进程内解码，无需启动 ffmpeg 子进程）
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):  # 系统缺少 libsndfile 时抛出 OSError
+    SOUNDFILE_AVAILABLE = False
+
+# soundfile 可直接解码的容器格式（MP3 需要 libsndfile >= 1.1，Ogg Opus 需要 libsndfile >= 1.0.29）
+SOUNDFILE_FORMATS = frozenset({
+    AudioFormat.WAV, AudioFormat.FLAC, AudioFormat.OGG, AudioFormat.MP3, AudioFormat.OPUS
+})
+
+# 样本宽度（字节）到 NumPy 整数类型的映射
+_DTYPE_MAP = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+@lru_cache(maxsize=16)
+def _get_resample_filter(up: int, down: int) -> np.ndarray:
+    """获取缓存的多相重采样 FIR 滤波器
+
+    与 resample_poly 默认设计一致（Kaiser 窗，beta=5.0），44.1kHz -> 16kHz 时长达数千阶，
+    缓存后同一采样率对不再重复设计滤波器。
+    """
+    max_rate = max(up, down)
+    fir = signal.firwin(20 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    fir.setflags(write=False)  # 缓存共享，禁止修改
+    return fir
+
+
+def _resample(audio_np: np.ndarray, orig_sample_rate: int, sample_rate: int) -> np.ndarray:
+    """使用缓存的滤波器做多相重采样，沿最后一个轴处理，输出 float32"""
+    g = math.gcd(orig_sample_rate, sample_rate)
+    up, down = sample_rate // g, orig_sample_rate // g
+    return signal.resample_poly(
+        audio_np, up, down, axis=-1, window=_get_resample_filter(up, down)
+    ).astype(np.float32, copy=False)
+
+
+def _finalize_float_audio(
+        audio_np: np.ndarray,
+        sample_rate: int,
+        sample_width: int,
+        output_format: str,
+        backend: str,
+        raise_on_error: bool = False
+) -> Optional[np.ndarray]:
+    """对归一化到 [-1, 1] 的浮点音频做噪声抑制，并转换为目标输出格式
+
+    PCM 与 soundfile 分支共用；整数输出按目标样本宽度校验，规则与 pydub 分支一致。
+    """
+    try:
+        audio_np = apply_noise_reduction(audio_np, sample_rate)
+        logger.debug("%s: 已应用噪声抑制处理", backend)
+    except Exception as e:
+        logger.warning("%s: 噪声抑制处理失败，使用原始音频: %s", backend, e)
+
+    if output_format == "pcm_f32le":
+        return audio_np.astype(np.float32, copy=False)
+
+    # 转为 int16，再由 _convert_to_output_format 校验格式与样本宽度
+    audio_np = (np.clip(audio_np, -1.0, 1.0) * 32767).astype(np.int16)
+    return _convert_to_output_format(audio_np, output_format, sample_width, raise_on_error)
+
+
+def convert_audio_format_pcm(
+        audio: AudioData,
+        sample_rate: int,
+        channels: int,
+        sample_width: int = 2,
+        output_format: str = "pcm_f32le",
+        raise_on_error: bool = False
+) -> Optional[np.ndarray]:
+    """使用 NumPy / SciPy 直接转换原始 PCM 数据
+
+    PCM 无需解码，直接按样本宽度解释字节、转换通道数并用多相滤波器重采样，
+    不经过 pydub 的 AudioSegment 拷贝和 audioop 线性插值。输出与 pydub 分支一致，
+    多声道为交错样本的一维数组。
+    """
+    try:
+        dtype = _DTYPE_MAP.get(audio.sample_width)
+        if dtype is None:
+            raise ValueError(f"不支持的 PCM 样本宽度: {audio.sample_width}")
+
+        # (frames, channels) 的整数样本
+        scale = float(2 ** (8 * audio.sample_width - 1))
+        data = np.frombuffer(audio.data, dtype=dtype).reshape(-1, audio.channels)
+
+        if channels == 1 and data.shape[1] > 1:
+            # 直接在整数样本上混音输出 float32 单声道，再原地归一化，
+            # 不生成多声道的 float32 中间数组
+            data = data.mean(axis=1, dtype=np.float32, keepdims=True)
+            data /= scale
+        else:
+            # 归一化到 [-1, 1]
+            data = np.divide(data, scale, dtype=np.float32)
+            if channels == 2 and data.shape[1] == 1:  # 转为立体声
+                data = np.repeat(data, 2, axis=1)
+
+        # 单声道为一维数组，多声道为 (channels, frames)，按声道分别重采样和滤波
+        audio_np = data[:, 0] if data.shape[1] == 1 else data.T
+
+        # 重采样
+        if audio.sample_rate != sample_rate:
+            audio_np = _resample(audio_np, audio.sample_rate, sample_rate)
+
+        audio_np = _finalize_float_audio(
+            audio_np, sample_rate, sample_width, output_format, "PCM", raise_on_error
+        )
+        # 与 pydub 分支保持一致：多声道输出交错样本的一维数组
+        if audio_np is not None and audio_np.ndim > 1:
+            audio_np = audio_np.T.reshape(-1)
+        return audio_np
+
+    except Exception as e:
+        logger.warning(f"PCM 音频转换失败: {e}")
+        if raise_on_error:
+            raise
+        return None
+
+
+def convert_audio_format_soundfile(
+        audio: AudioData,
+        sample_rate: int,
+        channels: int,
+        sample_width: int = 2,
+        output_format: str = "pcm_f32le",
+        raise_on_error: bool = False
+) -> Optional[np.ndarray]:
+    """使用 soundfile 转换音频格式
+
+    在进程内通过 libsndfile 解码，不像 pydub / torchaudio 的 ffmpeg 后端那样为每次解码启动子进程。
+    """
+    try:
+        # 解码为 (frames, channels) 的 float32 数组，范围 [-1, 1]
+        data, orig_sample_rate = sf.read(io.BytesIO(audio.data), dtype="float32", always_2d=True)
+
+        # 转换通道数
+        if data.shape[1] != channels:
+            if channels == 1:  # 转为单声道
+                data = data.mean(axis=1, keepdims=True)
+            elif channels == 2 and data.shape[1] == 1:  # 转为立体声
+                data = np.repeat(data, 2, axis=1)
+
+        # 与 torchaudio 分支保持一致：单声道为一维数组，多声道为 (channels, frames)
+        audio_np = data[:, 0] if data.shape[1] == 1 else data.T
+
+        # 重采样
+        if orig_sample_rate != sample_rate:
+            audio_np = _resample(audio_np, orig_sample_rate, sample_rate)
+
+        return _finalize_float_audio(
+            audio_np, sample_rate, sample_width, output_format, "soundfile", raise_on_error
+        )
+
+    except Exception as e:
+        logger.warning(f"soundfile 音频转换失败: {e}")
+        if raise_on_error:
+            raise
+        return None
+
+
+@lru_cache(maxsize=16)
+def _get_torchaudio_resampler(orig_sample_rate: int, sample_rate: int) -> "torchaudio.transforms.Resample":
+    """获取缓存的 torchaudio 重采样器，避免每次调用都重新计算多相滤波器核"""
+    return torchaudio.transforms.Resample(orig_sample_rate, sample_rate)
+
 
 def convert_audio_format_torchaudio(
         audio: AudioData,
@@ -123,8 +291,9 @@ def convert_audio_format_torchaudio(
 
         # 重采样
         if orig_sample_rate != sample_rate:
-            resampler = torchaudio.transforms.Resample(orig_sample_rate, sample_rate)
-            waveform = resampler(waveform)
+            resampler = _get_torchaudio_resampler(orig_sample_rate, sample_rate)
+            with torch.inference_mode():
+                waveform = resampler(waveform)
 
         # 转换通道数
         if waveform.shape[0] != channels:
@@ -138,14 +307,14 @@ def convert_audio_format_torchaudio(
 
         # 应用噪声抑制处理
         try:
-            audio_np = apply_noise_reduction(audio_np.astype(np.float32), sample_rate)
+            audio_np = apply_noise_reduction(audio_np.astype(np.float32, copy=False), sample_rate)
             logger.debug("torchaudio: 已应用噪声抑制处理")
         except Exception as e:
             logger.warning(f"torchaudio: 噪声抑制处理失败，使用原始音频: {e}")
 
         if output_format == "pcm_f32le":
             # torchaudio 输出已经是归一化的 [-1, 1] 范围
-            return audio_np.astype(np.float32)
+            return audio_np.astype(np.float32, copy=False)
         else:
             # 转为 int16
             audio_np = np.clip(audio_np, -1.0, 1.0)
@@ -167,9 +336,9 @@ def _load_audio_segment(audio: AudioData) -> "AudioSegment":
     Returns:
         pydub AudioSegment 对象
     """
-    if audio.format == AudioFormat.PCM:
+    if audio.format is AudioFormat.PCM:
         logger.debug(
-            f"从 PCM 数据加载: sr={audio.sample_rate}, ch={audio.channels}, sw={audio.sample_width}")
+            "从 PCM 数据加载: sr=%s, ch=%s, sw=%s", audio.sample_rate, audio.channels, audio.sample_width)
         return AudioSegment(
             data=audio.data,
             sample_width=audio.sample_width,
@@ -177,7 +346,7 @@ def _load_audio_segment(audio: AudioData) -> "AudioSegment":
             channels=audio.channels
         )
     else:
-        logger.debug(f"从文件格式 '{audio.format.value}' 加载音频数据。")
+        logger.debug("从文件格式 '%s' 加载音频数据。", audio.format.value)
         return AudioSegment.from_file(
             io.BytesIO(audio.data),
             format=audio.format.value
@@ -202,15 +371,15 @@ def _apply_audio_transformations(
         转换后的 AudioSegment 对象
     """
     if segment.frame_rate != sample_rate:
-        logger.debug(f"转换采样率: {segment.frame_rate} Hz -> {sample_rate} Hz")
+        logger.debug("转换采样率: %s Hz -> %s Hz", segment.frame_rate, sample_rate)
         segment = segment.set_frame_rate(sample_rate)
 
     if segment.channels != channels:
-        logger.debug(f"转换通道数: {segment.channels} -> {channels}")
+        logger.debug("转换通道数: %s -> %s", segment.channels, channels)
         segment = segment.set_channels(channels)
 
     if segment.sample_width != sample_width:
-        logger.debug(f"转换样本宽度: {segment.sample_width} bytes -> {sample_width} bytes")
+        logger.debug("转换样本宽度: %s bytes -> %s bytes", segment.sample_width, sample_width)
         segment = segment.set_sample_width(sample_width)
 
     return segment
@@ -226,8 +395,7 @@ def _segment_to_numpy(segment: "AudioSegment", sample_width: int) -> np.ndarray:
     Returns:
         NumPy 数组
     """
-    dtype_map = {1: np.int8, 2: np.int16, 4: np.int32}
-    dtype = dtype_map.get(sample_width, np.int16)
+    dtype = _DTYPE_MAP.get(sample_width, np.int16)
     return np.frombuffer(segment.raw_data, dtype=dtype)
 
 
@@ -250,13 +418,14 @@ def _convert_to_output_format(
     """
     if output_format == "pcm_f32le":
         if audio_np.dtype == np.int16:
-            audio_float32 = audio_np.astype(np.float32) / 32768.0
+            # 一次 ufunc 完成类型转换和归一化，不产生中间数组
+            audio_float32 = np.divide(audio_np, 32768.0, dtype=np.float32)
         else:
-            audio_float32 = audio_np.astype(np.float32)
-        logger.debug(f"成功将音频转换为归一化 float32 NumPy 数组，形状: {audio_float32.shape}")
+            audio_float32 = audio_np.astype(np.float32, copy=False)
+        logger.debug("成功将音频转换为归一化 float32 NumPy 数组，形状: %s", audio_float32.shape)
         return audio_float32
     elif output_format == "pcm_s16le" and sample_width == 2:
-        logger.debug(f"成功将音频转换为 int16 NumPy 数组，形状: {audio_np.shape}")
+        logger.debug("成功将音频转换为 int16 NumPy 数组，形状: %s", audio_np.shape)
         return audio_np
     else:
         error_msg = f"不支持的目标 ASR 格式 '{output_format}' 或与目标样本宽度不匹配。"
@@ -266,6 +435,46 @@ def _convert_to_output_format(
         return None
 
 
+def _convert_matching_pcm(
+        audio: AudioData,
+        sample_width: int,
+        output_format: str,
+        raise_on_error: bool = False
+) -> Optional[np.ndarray]:
+    """直接转换采样率、通道数、样本宽度均与目标一致的 PCM 数据
+
+    np.frombuffer 只创建原始字节的视图，不经过 AudioSegment 拷贝和 pydub 的格式转换，
+    输出与 pydub 分支一致（交错样本的一维数组）。
+
+    Args:
+        audio: 输入音频数据
+        sample_width: 目标样本宽度
+        output_format: 输出格式
+        raise_on_error: 发生错误时是否抛出异常
+
+    Returns:
+        转换后的 NumPy 数组
+    """
+    try:
+        audio_np = np.frombuffer(audio.data, dtype=_DTYPE_MAP[sample_width])
+
+        # 应用噪声抑制
+        try:
+            audio_np = apply_noise_reduction(audio_np, audio.sample_rate)
+            logger.debug("PCM: 已应用噪声抑制处理")
+        except Exception as e:
+            logger.warning(f"PCM: 噪声抑制处理失败，使用原始音频: {e}")
+
+        # 转换为目标格式
+        return _convert_to_output_format(audio_np, output_format, sample_width, raise_on_error)
+
+    except Exception as e:
+        logger.warning(f"PCM 音频转换失败: {e}")
+        if raise_on_error:
+            raise
+        return None
+
+
 def _convert_with_pydub(
         audio: AudioData,
         sample_rate: int,
@@ -329,7 +538,8 @@ def convert_audio_format(
 ) -> Optional[np.ndarray]:
     """将音频转换为 ASR 模型需要的格式
 
-    这是主入口函数，优先使用 torchaudio，失败后降级到 pydub。
+    这是主入口函数。原始 PCM 直接用 NumPy / SciPy 转换，WAV / FLAC / OGG / MP3
+    优先使用 soundfile 进程内解码，其次使用 torchaudio，失败后降级到 pydub。
 
     Args:
         audio: 输入音频数据
@@ -342,7 +552,40 @@ def convert_audio_format(
     Returns:
         转换后的 NumPy 数组，失败返回 None (除非 raise_on_error=True)
     """
-    # 优先使用 torchaudio
+    # AudioData.format 总是 AudioFormat 成员，可直接用 is 比较
+    audio_format = audio.format
+    is_pcm = audio_format is AudioFormat.PCM
+
+    # 原始 PCM 与目标格式完全一致时，只需解释字节并归一化
+    if (audio.data and is_pcm
+            and audio.sample_rate == sample_rate
+            and audio.channels == channels
+            and audio.sample_width == sample_width
+            and sample_width in _DTYPE_MAP):
+        logger.debug("PCM 格式与目标一致，跳过重采样和通道转换")
+        return _convert_matching_pcm(audio, sample_width, output_format, raise_on_error)
+
+    # 原始 PCM 无需解码，直接转换
+    if audio.data and is_pcm:
+        logger.debug("使用 NumPy 直接转换 PCM 音频")
+        result = convert_audio_format_pcm(
+            audio, sample_rate, channels, sample_width, output_format, raise_on_error=False
+        )
+        if result is not None:
+            return result
+        logger.debug("PCM 直接转换失败，尝试其他后端...")
+
+    # 容器格式优先使用 soundfile，避免 ffmpeg 子进程开销
+    if SOUNDFILE_AVAILABLE and audio.data and audio_format in SOUNDFILE_FORMATS:
+        logger.debug("尝试使用 soundfile 转换音频")
+        result = convert_audio_format_soundfile(
+            audio, sample_rate, channels, sample_width, output_format, raise_on_error=False
+        )
+        if result is not None:
+            return result
+        logger.debug("soundfile 无法解码该音频，尝试其他后端...")
+
+    # 其次使用 torchaudio
     if TORCHAUDIO_AVAILABLE:
         logger.debug("尝试使用 torchaudio 转换音频")
         result = convert_audio_format_torchaudio(
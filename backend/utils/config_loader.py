@@ -1,11 +1,25 @@
+import copy
 import os
 import re
 import yaml
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import aiofiles
 from backend.core.models.exceptions import ConfigurationError
 from backend.utils.logging_setup import logger
 
+# 优先使用 libyaml 的 C 加速解析器，未编译 libyaml 时回退到纯 Python 实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+# 环境变量引用: ${ENV_VAR} 或 ${ENV_VAR:default}
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+
+# 已解析配置的缓存: 绝对路径 -> (修改时间, 文件大小, 配置)
+# 任一 stat 字段变化即重新解析并替换该路径的条目，每个路径只保留一份
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 class ConfigLoader:
     @staticmethod
@@ -21,11 +35,25 @@ class ConfigLoader:
         Raises:
             ConfigurationError: 配置加载失败
         """
+        cache_path = os.path.abspath(config_path)
+        try:
+            stat = os.stat(config_path)
+            file_stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_stamp = None
+
+        # 调用方可能修改返回的配置，缓存命中时返回深拷贝
+        cached = _CONFIG_CACHE.get(cache_path)
+        if cached is not None and file_stamp is not None and cached[:2] == file_stamp:
+            return copy.deepcopy(cached[2])
+
         try:
             async with aiofiles.open(config_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                config_data = yaml.safe_load(content)
+                config_data = yaml.load(content, Loader=_YamlLoader)
             logger.info(f"配置加载器: 成功从 '{config_path}' 加载配置。")
+            if file_stamp is not None:
+                _CONFIG_CACHE[cache_path] = (*file_stamp, copy.deepcopy(config_data))
             return config_data
         except FileNotFoundError:
             msg = f"配置文件 '{config_path}' 未找到。"
@@ -54,22 +82,12 @@ class ConfigLoader:
         Returns:
             解析后的配置字典
         """
-        env_pattern = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
-
         def resolve_value(value: Any) -> Any:
             if isinstance(value, str):
-                def replacer(match: re.Match) -> str:
-                    env_name = match.group(1)
-                    default = match.group(2)
-                    env_value = os.getenv(env_name)
-                    if env_value is not None:
-                        return env_value
-                    if default is not None:
-                        return default
-                    logger.warning(f"环境变量 '{env_name}' 未设置且无默认值")
-                    return match.group(0)  # 保持原样
-
-                return env_pattern.sub(replacer, value)
+                # 绝大多数字符串不含引用，先用子串检查跳过正则扫描
+                if '${' not in value:
+                    return value
+                return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
             elif isinstance(value, dict):
                 return {k: resolve_value(v) for k, v in value.items()}
             elif isinstance(value, list):
@@ -77,3 +95,16 @@ class ConfigLoader:
             return value
 
         return resolve_value(config)
+
+
+def _replace_env_var(match: re.Match) -> str:
+    """将单个环境变量引用替换为环境变量值或默认值"""
+    env_name = match.group(1)
+    default = match.group(2)
+    env_value = os.getenv(env_name)
+    if env_value is not None:
+        return env_value
+    if default is not None:
+        return default
+    logger.warning(f"环境变量 '{env_name}' 未设置且无默认值")
+    return match.group(0)  # 保持原样
@@ -15,6 +15,12 @@ from backend.core.models.config_data import ConfigData
 from backend.core.models.exceptions import ConfigurationError
 from backend.utils.logging_setup import logger
 
+# 优先使用 libyaml 的 C 加速解析器，未编译 libyaml 时回退到纯 Python 实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 
 # 敏感字段关键词模式
 SENSITIVE_FIELD_PATTERNS: List[str] = [
@@ -156,7 +162,7 @@ class ConfigManager:
         try:
             async with aiofiles.open(self.config_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                config = yaml.safe_load(content) or {}
+                config = yaml.load(content, Loader=_YamlLoader) or {}
                 self._config_cache = config
                 return copy.deepcopy(config)
         except FileNotFoundError:
@@ -0,0 +1,35 @@
+from backend.utils.logging_setup import logger
+
+# 自动选择设备的配置值
+AUTO_DEVICE = "auto"
+
+
+def resolve_device(device: str) -> str:
+    """解析模型运行设备
+
+    当配置为 "auto" 时，按 CUDA -> MPS -> CPU 的顺序选择可用的加速设备；
+    其他值原样返回。
+
+    Args:
+        device: 配置中的设备名称 ("auto", "cpu", "cuda", "mps" 等)
+
+    Returns:
+        实际使用的设备名称
+    """
+    if device != AUTO_DEVICE:
+        return device
+
+    try:
+        import torch
+    except ImportError:
+        logger.debug("torch 未安装，设备自动选择回退到 cpu")
+        return "cpu"
+
+    if torch.cuda.is_available():
+        return "cuda"
+
+    mps_backend = getattr(torch.backends, "mps", None)
+    if mps_backend is not None and mps_backend.is_available():
+        return "mps"
+
+    return "cpu"
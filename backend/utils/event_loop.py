@@ -0,0 +1,24 @@
+import asyncio
+from typing import Callable, Optional
+
+# uvloop 为可选依赖（pip install chat-bot[speedups]，不支持 Windows），未安装时使用 asyncio 默认事件循环
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    uvloop = None  # type: ignore
+    UVLOOP_AVAILABLE = False
+
+
+def get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """获取事件循环工厂
+
+    用于 asyncio.run(main(), loop_factory=get_loop_factory())。
+
+    Returns:
+        uvloop 可用时返回 uvloop.new_event_loop，否则返回 None（使用默认事件循环）
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop.new_event_loop
+    return None
@@ -103,19 +103,15 @@ async def initialize_single_module_instance(
         # 解析适配器配置（支持 enable_module 选择子配置）
         adapter_config = resolve_adapter_config(module_config)
 
+        factory_kwargs: Dict[str, Any] = {
+            "adapter_type": adapter_type,
+            "module_id": module_id,
+            "config": adapter_config,
+        }
         if conversation_manager is not None:
-            module_instance: Union[BaseModule, BaseProtocol] = factory(
-                adapter_type=adapter_type,
-                module_id=module_id,
-                config=adapter_config,
-                conversation_manager=conversation_manager
-            )
-        else:
-            module_instance: Union[BaseModule, BaseProtocol] = factory(
-                adapter_type=adapter_type,
-                module_id=module_id,
-                config=adapter_config
-            )
+            factory_kwargs["conversation_manager"] = conversation_manager
+
+        module_instance: Union[BaseModule, BaseProtocol] = factory(**factory_kwargs)
 
         # 验证模块实例的类型
         if not isinstance(module_instance, base_class):
@@ -0,0 +1,123 @@
+"""
+测试脚本共用的音频工具
+
+供 tests/ 下的 TTS / VAD 端到端脚本导入（需在项目根目录下以 PYTHONPATH=. 运行）:
+
+    from tests.audio_utils import convert_mp3_to_pcm, iter_windows
+"""
+import io
+import math
+import socket
+import subprocess
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+# Edge TTS 服务地址，用于离线时快速跳过依赖网络的测试
+EDGE_TTS_HOST = "speech.platform.bing.com"
+
+
+def convert_mp3_to_pcm(mp3_bytes: bytes, target_sr: int = 16000) -> Optional[bytes]:
+    """将 MP3 音频转换为 PCM 格式 (int16, mono)
+
+    优先使用 soundfile 在进程内解码（libsndfile >= 1.1 支持 MP3），不必为每段音频
+    启动 ffmpeg 子进程；不可用时依次尝试 pydub (需要 ffmpeg) 和通过管道调用 ffmpeg 命令行。
+
+    Args:
+        mp3_bytes: MP3 音频数据
+        target_sr: 目标采样率 (Hz)
+
+    Returns:
+        s16le 单声道 PCM 数据，转换失败返回 None
+    """
+    # 方案 1: soundfile 进程内解码
+    try:
+        import soundfile as sf
+        from scipy import signal
+
+        data, sample_rate = sf.read(io.BytesIO(bytes(mp3_bytes)), dtype="float32", always_2d=True)
+        audio = data.mean(axis=1)  # 转单声道
+
+        # 重采样
+        if sample_rate != target_sr:
+            g = math.gcd(sample_rate, target_sr)
+            audio = signal.resample_poly(audio, target_sr // g, sample_rate // g)
+
+        return (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    except (ImportError, OSError):  # 未安装 soundfile 或系统缺少 libsndfile
+        pass
+    except Exception as e:
+        print(f"soundfile 解码失败: {e}")
+
+    # 方案 2: 尝试 pydub
+    try:
+        from pydub import AudioSegment
+
+        segment = AudioSegment.from_mp3(io.BytesIO(mp3_bytes))
+
+        # 重采样
+        if segment.frame_rate != target_sr:
+            segment = segment.set_frame_rate(target_sr)
+
+        # 转单声道
+        if segment.channels > 1:
+            segment = segment.set_channels(1)
+
+        # 确保 16bit
+        if segment.sample_width != 2:
+            segment = segment.set_sample_width(2)
+
+        return segment.raw_data
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"Pydub 转换失败: {e}")
+
+    # 方案 3: 使用 ffmpeg 命令行，通过管道输入 MP3、输出原始 s16le PCM，不落盘
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-loglevel", "quiet", "-i", "pipe:0",
+                "-f", "s16le", "-ar", str(target_sr), "-ac", "1", "pipe:1",
+            ],
+            input=bytes(mp3_bytes),
+            capture_output=True,
+            check=True,
+            timeout=30,
+        )
+        return result.stdout or None
+    except Exception as e:
+        print(f"FFmpeg 转换失败: {e}")
+        return None
+
+
+def iter_windows(
+        pcm: bytes, window_size_bytes: int
+) -> Iterator[Tuple[int, Union[memoryview, bytes]]]:
+    """按固定窗口切分 PCM 数据
+
+    窗口为原数据的 memoryview 切片，不复制字节；只有不足一个窗口的最后一块
+    才会复制并补零。
+
+    Args:
+        pcm: PCM 音频数据
+        window_size_bytes: 窗口大小 (字节)
+
+    Yields:
+        (字节偏移, 窗口数据)
+    """
+    view = memoryview(pcm)
+    for offset in range(0, len(view), window_size_bytes):
+        window = view[offset:offset + window_size_bytes]
+        if len(window) < window_size_bytes:
+            window = bytes(window) + bytes(window_size_bytes - len(window))
+        yield offset, window
+
+
+def edge_tts_reachable(timeout: float = 1.5) -> bool:
+    """快速检查 Edge TTS 服务是否可达，避免离线时等待网络超时"""
+    try:
+        with socket.create_connection((EDGE_TTS_HOST, 443), timeout=timeout):
+            return True
+    except OSError:
+        return False
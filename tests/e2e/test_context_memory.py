@@ -20,6 +20,7 @@ import logging
 import os
 import sys
 import uuid
+from pathlib import Path
 from typing import Optional
 
 import websockets
@@ -32,6 +33,7 @@ from backend.core.engine.chat_engine import ChatEngine
 from backend.core.models import StreamEvent, EventType, TextData
 from backend.core.session.session_manager import SessionManager, InMemoryStorage
 from backend.utils.config_loader import ConfigLoader
+from backend.utils.event_loop import get_loop_factory
 from backend.utils.logging_setup import setup_logging
 
 # 配置日志
@@ -45,6 +47,7 @@ logger = logging.getLogger("ContextMemoryTest")
 SERVER_HOST = "127.0.0.1"
 SERVER_PORT = 28765  # 使用不同端口避免冲突
 WS_URL = f"ws://{SERVER_HOST}:{SERVER_PORT}"
+CONFIG_PATH = Path(__file__).resolve().parents[2] / "backend" / "configs" / "config.yaml"
 
 
 class ChatEngineTestServer:
@@ -59,9 +62,7 @@ class ChatEngineTestServer:
         logger.info("正在启动测试服务器...")
 
         # 1. 加载配置
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        config_path = os.path.join(project_root, "backend", "configs", "config.yaml")
-        config = await ConfigLoader.load_config(config_path)
+        config = await ConfigLoader.load_config(str(CONFIG_PATH))
 
         # 修改配置以适应测试
         # 删除 TTS, VAD, ASR 配置以简化测试 (只测试 LLM 上下文)
@@ -94,8 +95,12 @@ class ChatEngineTestServer:
         # 在后台启动服务器
         self.server_task = asyncio.create_task(protocol.start())
 
-        # 等待服务器启动
-        await asyncio.sleep(1)
+        # 等待服务器开始监听，而不是固定睡眠
+        async with asyncio.timeout(5.0):
+            while protocol.server is None:
+                if self.server_task.done():
+                    self.server_task.result()  # 启动失败时抛出异常
+                await asyncio.sleep(0.01)
         logger.info(f"测试服务器已启动: {WS_URL}")
 
     async def stop(self):
@@ -124,8 +129,38 @@ class ChatEngineTestServer:
         logger.info("测试服务器已关闭")
 
 
+# 读取任务结束时放入队列的哨兵，唤醒等待中的 next_message
+_CONNECTION_CLOSED = object()
+
+
+async def read_messages(ws, messages: asyncio.Queue) -> None:
+    """后台读取 WebSocket 消息并放入队列
+
+    整个连接只使用一个读取任务，调用方从队列中取消息。
+    连接关闭或读取出错时放入哨兵，异常保留在任务上，由 next_message 重新抛出。
+    """
+    try:
+        async for raw_message in ws:
+            messages.put_nowait(raw_message)
+    finally:
+        messages.put_nowait(_CONNECTION_CLOSED)
+
+
+async def next_message(messages: asyncio.Queue, reader_task: asyncio.Task) -> str:
+    """从队列中取下一条消息，连接已关闭时立即抛出异常而不是等到超时"""
+    message = await messages.get()
+    if message is _CONNECTION_CLOSED:
+        messages.put_nowait(_CONNECTION_CLOSED)  # 保留哨兵，后续调用同样立即失败
+        if reader_task.done() and not reader_task.cancelled():
+            reader_task.result()  # 读取任务异常时重新抛出
+        raise ConnectionError("WebSocket 连接已关闭")
+    return message
+
+
 async def send_and_receive(
     ws,
+    messages: asyncio.Queue,
+    reader_task: asyncio.Task,
     session_id: str,
     tag_id: str,
     message: str,
@@ -135,10 +170,12 @@ async def send_and_receive(
 
     Args:
         ws: WebSocket 连接
+        messages: 由 read_messages 填充的消息队列
+        reader_task: 运行 read_messages 的任务
         session_id: 会话 ID
         tag_id: 标签 ID
         message: 要发送的消息
-        timeout: 超时时间（秒）
+        timeout: 整轮对话的超时时间（秒）
 
     Returns:
         完整的回复文本
@@ -153,55 +190,40 @@ async def send_and_receive(
     await ws.send(input_event.to_json())
     logger.info(f"发送消息: {message}")
 
-    # 接收回复
-    response_text = ""
-    start_time = asyncio.get_event_loop().time()
-
-    while True:
-        # 检查超时
-        elapsed = asyncio.get_event_loop().time() - start_time
-        if elapsed > timeout:
-            logger.warning(f"等待回复超时 ({timeout}s)")
-            break
-
-        try:
-            response = await asyncio.wait_for(ws.recv(), timeout=5.0)
-            event = StreamEvent.from_json(response)
-
-            if event.event_type == EventType.SERVER_TEXT_RESPONSE:
-                text_data = event.event_data
-                # text_data 可能是 TextData 对象或字典
-                if isinstance(text_data, TextData):
-                    text = text_data.text
-                    is_final = text_data.is_final
-                elif isinstance(text_data, dict):
-                    text = text_data.get("text", "")
-                    is_final = text_data.get("is_final", False)
-                else:
-                    text = ""
-                    is_final = False
+    # 接收回复（分片收集，最后一次性拼接），整轮对话共用一个截止时间
+    response_parts = []
 
-                if text:
-                    response_text += text
-                    print(text, end="", flush=True)
+    try:
+        async with asyncio.timeout(timeout):
+            while True:
+                response = await next_message(messages, reader_task)
+                event = StreamEvent.from_json(response)
 
-                # 检查是否为最终回复
-                if is_final:
-                    print()  # 换行
-                    break
+                if event.event_type == EventType.SERVER_TEXT_RESPONSE:
+                    # from_json 已按 EVENT_DATA_TYPE_MAP 将 event_data 解析为 TextData
+                    text_data = event.event_data
+                    text = text_data.text if text_data else ""
+                    is_final = text_data.is_final if text_data else False
+
+                    if text:
+                        response_parts.append(text)
+                        print(text, end="", flush=True)
 
-            elif event.event_type == EventType.ERROR:
-                logger.error(f"收到错误: {event.event_data}")
-                break
+                    # 检查是否为最终回复
+                    if is_final:
+                        print()  # 换行
+                        break
+
+                elif event.event_type == EventType.ERROR:
+                    logger.error(f"收到错误: {event.event_data}")
+                    break
 
-        except asyncio.TimeoutError:
-            # 如果已经收到一些内容，认为对话结束
-            if response_text:
-                print()
-                break
-            continue
+    except TimeoutError:
+        if response_parts:
+            print()
+        logger.warning(f"等待回复超时 ({timeout}s)")
 
-    return response_text
+    return "".join(response_parts)
 
 
 async def run_context_memory_test() -> bool:
@@ -221,65 +243,71 @@ async def run_context_memory_test() -> bool:
         async with websockets.connect(WS_URL, ping_interval=None) as ws:
             logger.info("WebSocket 连接建立")
 
-            # 1. 发送注册事件
-            tag_id = f"test_client_{uuid.uuid4().hex[:8]}"
-            register_event = StreamEvent(
-                event_type=EventType.SYSTEM_CLIENT_SESSION_START,
-                tag_id=tag_id
-            )
-            await ws.send(register_event.to_json())
-            logger.info("发送注册请求")
-
-            # 等待会话确认
-            session_id = None
-            while not session_id:
-                response = await asyncio.wait_for(ws.recv(), timeout=10.0)
-                event = StreamEvent.from_json(response)
-                if event.event_type == EventType.SYSTEM_SERVER_SESSION_START:
-                    session_id = event.session_id
-                    logger.info(f"收到会话确认: session_id={session_id}")
-                elif event.event_type == EventType.ERROR:
-                    logger.error(f"注册失败: {event.event_data}")
+            messages: asyncio.Queue = asyncio.Queue()
+            reader_task = asyncio.create_task(read_messages(ws, messages))
+            try:
+                # 1. 发送注册事件
+                tag_id = f"test_client_{uuid.uuid4().hex[:8]}"
+                register_event = StreamEvent(
+                    event_type=EventType.SYSTEM_CLIENT_SESSION_START,
+                    tag_id=tag_id
+                )
+                await ws.send(register_event.to_json())
+                logger.info("发送注册请求")
+
+                # 等待会话确认
+                session_id = None
+                async with asyncio.timeout(10.0):
+                    while not session_id:
+                        response = await next_message(messages, reader_task)
+                        event = StreamEvent.from_json(response)
+                        if event.event_type == EventType.SYSTEM_SERVER_SESSION_START:
+                            session_id = event.session_id
+                            logger.info(f"收到会话确认: session_id={session_id}")
+                        elif event.event_type == EventType.ERROR:
+                            logger.error(f"注册失败: {event.event_data}")
+                            return False
+
+                # 2. 第一轮对话: 发送"我叫小明"
+                logger.info("\n" + "="*50)
+                logger.info("[Round 1] 开始第一轮对话")
+                logger.info("="*50)
+                response1 = await send_and_receive(
+                    ws, messages, reader_task, session_id, tag_id,
+                    "我叫小明",
+                    timeout=30.0
+                )
+                logger.info(f"[Round 1] 完整回复: {response1}")
+
+                # 短暂等待
+                await asyncio.sleep(0.5)
+
+                # 3. 第二轮对话: 发送"我刚才说我叫什么？"
+                logger.info("\n" + "="*50)
+                logger.info("[Round 2] 开始第二轮对话")
+                logger.info("="*50)
+                response2 = await send_and_receive(
+                    ws, messages, reader_task, session_id, tag_id,
+                    "我刚才说我叫什么？",
+                    timeout=30.0
+                )
+                logger.info(f"[Round 2] 完整回复: {response2}")
+
+                # 4. 验证结果
+                logger.info("\n" + "="*50)
+                logger.info("测试结果验证")
+                logger.info("="*50)
+
+                if "小明" in response2:
+                    logger.info("SUCCESS: 上下文保持正常，LLM 记住了名字 '小明'")
+                    return True
+                else:
+                    logger.error("FAILURE: 上下文丢失，LLM 未能回忆起名字")
+                    logger.error(f"  期望: 回复中包含 '小明'")
+                    logger.error(f"  实际: {response2}")
                     return False
-
-            # 2. 第一轮对话: 发送"我叫小明"
-            logger.info("\n" + "="*50)
-            logger.info("[Round 1] 开始第一轮对话")
-            logger.info("="*50)
-            response1 = await send_and_receive(
-                ws, session_id, tag_id,
-                "我叫小明",
-                timeout=30.0
-            )
-            logger.info(f"[Round 1] 完整回复: {response1}")
-
-            # 短暂等待
-            await asyncio.sleep(0.5)
-
-            # 3. 第二轮对话: 发送"我刚才说我叫什么？"
-            logger.info("\n" + "="*50)
-            logger.info("[Round 2] 开始第二轮对话")
-            logger.info("="*50)
-            response2 = await send_and_receive(
-                ws, session_id, tag_id,
-                "我刚才说我叫什么？",
-                timeout=30.0
-            )
-            logger.info(f"[Round 2] 完整回复: {response2}")
-
-            # 4. 验证结果
-            logger.info("\n" + "="*50)
-            logger.info("测试结果验证")
-            logger.info("="*50)
-
-            if "小明" in response2:
-                logger.info("SUCCESS: 上下文保持正常，LLM 记住了名字 '小明'")
-                return True
-            else:
-                logger.error("FAILURE: 上下文丢失，LLM 未能回忆起名字")
-                logger.error(f"  期望: 回复中包含 '小明'")
-                logger.error(f"  实际: {response2}")
-                return False
+            finally:
+                reader_task.cancel()
 
     except Exception as e:
         logger.error(f"测试过程发生错误: {e}", exc_info=True)
@@ -317,4 +345,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=get_loop_factory())
@@ -18,48 +18,67 @@
 
 import asyncio
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 from difflib import SequenceMatcher
 
 # 添加项目根目录到 Python 路径
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CONFIG_PATH = PROJECT_ROOT / "backend" / "configs" / "config.yaml"
+OUTPUT_DIR = PROJECT_ROOT / "outputs" / "e2e_test"
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # 加载 .env 文件
 from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / ".env")
 
+import aiofiles
 import yaml
 
 from backend.core.models import AudioData, AudioFormat, TextData
+from backend.utils.event_loop import get_loop_factory
 from backend.utils.logging_setup import setup_logging, logger
 
+# 优先使用 libyaml 的 C 解析器，不可用时回退到纯 Python 实现
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# SenseVoice 特有的标记，如 <|zh|>, <|NEUTRAL|>, <|Speech|>, <|woitn|> 等
+_TAG_RE = re.compile(r'<\|[^>]+\|>')
+# 中文关键词（长度 >= 2 的连续中文字符）
+_CJK_RE = re.compile(r'[\u4e00-\u9fa5]{2,}')
+# 标点和空格
+_PUNCT_RE = re.compile(r'[^\w]')
+
 
 def load_config() -> Dict[str, Any]:
     """加载配置文件"""
-    config_path = PROJECT_ROOT / "backend" / "configs" / "config.yaml"
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
     """计算两个文本的相似度（0-1）"""
     # 移除标点和空格进行比较
-    import re
-    clean1 = re.sub(r'[^\w]', '', text1)
-    clean2 = re.sub(r'[^\w]', '', text2)
+    clean1 = _PUNCT_RE.sub('', text1)
+    clean2 = _PUNCT_RE.sub('', text2)
     return SequenceMatcher(None, clean1.lower(), clean2.lower()).ratio()
 
 
-def contains_key_words(original: str, recognized: str) -> bool:
-    """检查识别结果是否包含原文的关键词"""
-    import re
-    # 提取中文关键词（长度 >= 2 的连续中文字符）
-    pattern = r'[\u4e00-\u9fa5]{2,}'
-    original_words = set(re.findall(pattern, original))
-    recognized_words = set(re.findall(pattern, recognized))
+def extract_key_words(text: str) -> Set[str]:
+    """提取文本中的中文关键词"""
+    return set(_CJK_RE.findall(text))
+
+
+def contains_key_words(original_words: Set[str], recognized: str) -> bool:
+    """检查识别结果是否包含原文的关键词
+
+    Args:
+        original_words: 原文关键词集合（由 extract_key_words 预先计算）
+        recognized: 识别结果文本
+    """
+    recognized_words = extract_key_words(recognized)
 
     if not original_words:
         return True  # 没有中文关键词时跳过检查
@@ -134,21 +153,22 @@ async def _run_llm_response(llm_adapter, question: str, session_id: str) -> str:
     logger.info(f"{'='*60}")
 
     input_text = TextData(text=question)
-    full_response = ""
+    response_parts = []
 
     async for chunk in llm_adapter.chat_stream(input_text, session_id):
         if chunk.text:
-            full_response += chunk.text
+            response_parts.append(chunk.text)
             print(chunk.text, end="", flush=True)
 
     print()  # 换行
+    full_response = "".join(response_parts)
     logger.info(f"\n步骤 2: LLM 回复完成")
     logger.info(f"完整回复: {full_response}")
 
     return full_response
 
 
-async def _run_tts_synthesis(tts_adapter, text: str) -> bytes:
+async def _run_tts_synthesis(tts_adapter, text: str) -> bytearray:
     """执行 TTS 语音合成步骤"""
     logger.info(f"\n{'='*60}")
     logger.info(f"步骤 3: 将文字转换为语音 (TTS)")
@@ -156,15 +176,14 @@ async def _run_tts_synthesis(tts_adapter, text: str) -> bytes:
     logger.info(f"{'='*60}")
 
     input_text = TextData(text=text)
-    audio_chunks = []
+    # 直接在同一块缓冲区中追加音频块，避免先收集列表再 join 的二次拷贝
+    full_audio = bytearray()
 
     async for audio_chunk in tts_adapter.synthesize_stream(input_text):
         if audio_chunk.data and len(audio_chunk.data) > 1:  # 排除占位符
-            audio_chunks.append(audio_chunk.data)
+            full_audio.extend(audio_chunk.data)
             logger.debug(f"收到音频块: {len(audio_chunk.data)} 字节")
 
-    # 合并所有音频块
-    full_audio = b"".join(audio_chunks)
     logger.info(f"TTS 合成完成，总音频大小: {len(full_audio)} 字节")
 
     return full_audio
@@ -197,9 +216,7 @@ async def _run_asr_recognition(asr_adapter, audio_data: bytes) -> str:
 
 def clean_asr_output(text: str) -> str:
     """清理 ASR 输出中的特殊标记"""
-    import re
-    # 移除 SenseVoice 特有的标记，如 <|zh|>, <|NEUTRAL|>, <|Speech|>, <|woitn|> 等
-    cleaned = re.sub(r'<\|[^>]+\|>', '', text)
+    cleaned = _TAG_RE.sub('', text)
     return cleaned.strip()
 
 
@@ -211,6 +228,9 @@ def verify_results(original_text: str, recognized_text: str) -> bool:
     logger.info(f"原始文本: {original_text}")
     logger.info(f"原始识别: {recognized_text}")
 
+    # 原文关键词只计算一次
+    original_words = extract_key_words(original_text)
+
     # 清理 ASR 输出中的特殊标记
     cleaned_recognized = clean_asr_output(recognized_text)
     logger.info(f"清理后识别: {cleaned_recognized}")
@@ -220,7 +240,7 @@ def verify_results(original_text: str, recognized_text: str) -> bool:
     logger.info(f"文本相似度: {similarity:.2%}")
 
     # 检查关键词匹配
-    keywords_match = contains_key_words(original_text, cleaned_recognized)
+    keywords_match = contains_key_words(original_words, cleaned_recognized)
     logger.info(f"关键词匹配: {'通过' if keywords_match else '失败'}")
 
     # 验证条件：相似度 >= 30% 或 关键词匹配
@@ -251,17 +271,23 @@ async def run_e2e_test():
     asr_adapter = None
 
     try:
-        # 创建适配器
+        # 创建适配器（三者互不依赖，并发初始化）
         logger.info("正在初始化适配器...")
 
-        llm_adapter = await create_llm_adapter(config)
-        logger.info("LLM 适配器初始化完成")
-
-        tts_adapter = await create_tts_adapter(config)
-        logger.info("TTS 适配器初始化完成")
-
-        asr_adapter = await create_asr_adapter(config)
-        logger.info("ASR 适配器初始化完成")
+        results = await asyncio.gather(
+            create_llm_adapter(config),
+            create_tts_adapter(config),
+            create_asr_adapter(config),
+            return_exceptions=True,
+        )
+        # 先保留初始化成功的适配器，确保 finally 中能够释放
+        llm_adapter, tts_adapter, asr_adapter = (
+            None if isinstance(result, BaseException) else result for result in results
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        logger.info("LLM / TTS / ASR 适配器初始化完成")
 
         # 测试问题
         question = "用一句话介绍自己"
@@ -282,12 +308,11 @@ async def run_e2e_test():
             return False
 
         # 保存音频文件（用于调试）
-        output_dir = PROJECT_ROOT / "outputs" / "e2e_test"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-        audio_file = output_dir / "test_audio.mp3"
-        with open(audio_file, "wb") as f:
-            f.write(audio_data)
+        audio_file = OUTPUT_DIR / "test_audio.mp3"
+        async with aiofiles.open(audio_file, "wb") as f:
+            await f.write(audio_data)
         logger.info(f"音频已保存到: {audio_file}")
 
         # 步骤 4: ASR 识别
@@ -320,12 +345,10 @@ async def run_e2e_test():
         # 清理资源
         logger.info("正在清理资源...")
 
-        if llm_adapter:
-            await llm_adapter.close()
-        if tts_adapter:
-            await tts_adapter.close()
-        if asr_adapter:
-            await asr_adapter.close()
+        await asyncio.gather(
+            *(adapter.close() for adapter in (llm_adapter, tts_adapter, asr_adapter) if adapter),
+            return_exceptions=True,
+        )
 
         logger.info("资源清理完成")
 
@@ -339,5 +362,5 @@ async def test_e2e_llm_tts_asr():
 
 if __name__ == "__main__":
     # 直接运行测试
-    success = asyncio.run(run_e2e_test())
+    success = asyncio.run(run_e2e_test(), loop_factory=get_loop_factory())
     sys.exit(0 if success else 1)
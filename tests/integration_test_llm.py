@@ -11,6 +11,7 @@ from langchain_core.messages import SystemMessage
 
 from backend.adapters.llm.langchain_llm_adapter import LangChainLLMAdapter
 from backend.core.models import TextData
+from backend.utils.event_loop import get_loop_factory
 
 async def test_llm_adapter():
     """测试 LangChainLLMAdapter"""
@@ -62,7 +63,7 @@ async def test_llm_adapter():
 
     # 4. 接收流式回复
     print("📥 接收回复: ", end="", flush=True)
-    full_response = ""
+    response_parts = []
     received_chunks = 0
 
     try:
@@ -73,10 +74,11 @@ async def test_llm_adapter():
             content = chunk.text
             if content:
                 print(content, end="", flush=True)
-                full_response += content
+                response_parts.append(content)
                 received_chunks += 1
 
         print("\n")
+        full_response = "".join(response_parts)
 
         # 5. 验证结果
         print("-" * 30)
@@ -96,4 +98,4 @@ async def test_llm_adapter():
         await adapter._close_impl()
 
 if __name__ == "__main__":
-    asyncio.run(test_llm_adapter())
+    asyncio.run(test_llm_adapter(), loop_factory=get_loop_factory())
@@ -1,28 +1,25 @@
 import asyncio
 import os
 import sys
-import yaml
-import numpy as np
-import torch
-import logging
 from pathlib import Path
 
 # 添加项目根目录到 sys.path
 sys.path.append(os.getcwd())
 
-from backend.adapters.vad.silero_vad_adapter import SileroVADAdapter
+from backend.utils.config_loader import ConfigLoader
 from backend.utils.logging_setup import setup_logging
-from backend.core.config_models import AppConfig
+from backend.utils.event_loop import get_loop_factory
+
+CONFIG_PATH = Path("backend/configs/config.yaml")
 
 async def test_vad_loading():
     print("--- 1. 读取配置文件 ---")
-    config_path = Path("backend/configs/config.yaml")
-    if not config_path.exists():
-        print(f"Error: Config file not found at {config_path}")
+    if not CONFIG_PATH.exists():
+        print(f"Error: Config file not found at {CONFIG_PATH}")
         return
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_dict = yaml.safe_load(f)
+    # 使用异步读取，避免在协程中阻塞事件循环
+    config_dict = await ConfigLoader.load_config(str(CONFIG_PATH))
 
     # 初始化日志
     setup_logging(config_dict.get("logging", {}))
@@ -45,6 +42,9 @@ async def test_vad_loading():
     print(f"VAD Config: {vad_specific_config}")
 
     print("\n--- 2. 创建并初始化 SileroVADAdapter ---")
+    # 延迟导入：SileroVADAdapter 会连带导入 torch，只在真正运行时加载
+    from backend.adapters.vad.silero_vad_adapter import SileroVADAdapter
+
     try:
         vad_adapter = SileroVADAdapter(
             module_id="vad_test",
@@ -78,15 +78,15 @@ async def test_vad_loading():
     num_samples = int(sample_rate * duration_sec)
 
     # 生成静音 (全0) - int16 bytes
-    silence_audio_np = np.zeros(num_samples, dtype=np.int16)
-    silence_audio_bytes = silence_audio_np.tobytes()
+    silence_audio_bytes = bytes(num_samples * 2)
 
     print(f"Testing with {duration_sec}s silence ({len(silence_audio_bytes)} bytes)...")
 
     try:
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         result = await vad_adapter.detect(silence_audio_bytes)
-        end_time = asyncio.get_event_loop().time()
+        end_time = loop.time()
 
         print(f"Detection result: {result}")
         print(f"Time taken: {(end_time - start_time)*1000:.2f} ms")
@@ -110,4 +110,4 @@ async def test_vad_loading():
     print("Test finished.")
 
 if __name__ == "__main__":
-    asyncio.run(test_vad_loading())
+    asyncio.run(test_vad_loading(), loop_factory=get_loop_factory())
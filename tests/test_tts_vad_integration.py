@@ -13,70 +13,16 @@
     python3 tests/test_tts_vad_integration.py
 """
 import asyncio
-import io
 import os
-import subprocess
 import sys
 
 import numpy as np
-import torch
 
 from backend.adapters.tts.edge_tts_adapter import EdgeTTSAdapter
 from backend.adapters.vad.silero_vad_adapter import SileroVADAdapter
 from backend.core.models import TextData
-
-
-def convert_mp3_to_pcm(mp3_bytes: bytes, target_sr: int = 16000) -> bytes:
-    """将 MP3 音频转换为 PCM 格式 (int16, mono)
-
-    尝试使用 pydub (需要 ffmpeg) 或 subprocess 调用 ffmpeg
-    """
-    # 方案 1: 尝试 pydub
-    try:
-        from pydub import AudioSegment
-
-        audio_f = io.BytesIO(mp3_bytes)
-        segment = AudioSegment.from_mp3(audio_f)
-
-        # 重采样
-        if segment.frame_rate != target_sr:
-            segment = segment.set_frame_rate(target_sr)
-
-        # 转单声道
-        if segment.channels > 1:
-            segment = segment.set_channels(1)
-
-        # 确保 16bit
-        if segment.sample_width != 2:
-            segment = segment.set_sample_width(2)
-
-        return segment.raw_data
-    except Exception:
-        pass
-
-    # 方案 2: 使用 ffmpeg 命令行
-    try:
-        tmp_mp3 = "/tmp/tts_test_output.mp3"
-        tmp_wav = "/tmp/tts_test_output.wav"
-
-        with open(tmp_mp3, "wb") as f:
-            f.write(mp3_bytes)
-
-        result = subprocess.run(
-            ["ffmpeg", "-y", "-i", tmp_mp3, "-ar", str(target_sr), "-ac", "1", tmp_wav],
-            capture_output=True,
-            timeout=30,
-        )
-        if result.returncode == 0 and os.path.exists(tmp_wav):
-            import soundfile as sf
-
-            data, _ = sf.read(tmp_wav)
-            audio_int16 = (data * 32767).astype(np.int16)
-            return audio_int16.tobytes()
-    except Exception:
-        pass
-
-    return None
+from backend.utils.event_loop import get_loop_factory
+from tests.audio_utils import convert_mp3_to_pcm, edge_tts_reachable, iter_windows
 
 
 async def test_tts_to_vad():
@@ -99,11 +45,16 @@ async def test_tts_to_vad():
         "model_repo_path": "outputs/models/vad/silero-vad",
         "model_name": "silero_vad",
         "threshold": 0.5,
-        "device": "cpu",
+        # 默认自动选择 CUDA / MPS / CPU，可通过 VAD_TEST_DEVICE 强制指定（如 CPU-only CI）
+        "device": os.getenv("VAD_TEST_DEVICE", "auto"),
         "window_size_samples": 512,
         "sample_rate": 16000,
     }
 
+    if not edge_tts_reachable():
+        print("[SKIP] Edge TTS 服务不可达，跳过测试")
+        return None
+
     # 2. 初始化适配器
     print("[步骤 1/4] 初始化适配器...")
     tts_adapter = EdgeTTSAdapter("tts-test", tts_config)
@@ -121,13 +72,12 @@ async def test_tts_to_vad():
         print(f"\n[步骤 2/4] 执行 TTS: '{text}'...")
 
         text_data = TextData(text=text)
-        audio_chunks = []
+        full_audio = bytearray()
 
         async for chunk in tts_adapter.synthesize_stream(text_data):
             if not chunk.is_final and chunk.data:
-                audio_chunks.append(chunk.data)
+                full_audio.extend(chunk.data)
 
-        full_audio = b"".join(audio_chunks)
         print(f"[OK] TTS 生成完成，音频大小: {len(full_audio)} 字节")
 
         # 4. 音频格式转换
@@ -156,25 +106,14 @@ async def test_tts_to_vad():
         # 重置 VAD 状态
         await vad_adapter.reset_state()
 
-        for i in range(0, len(audio_bytes), window_size_bytes):
-            chunk = audio_bytes[i : i + window_size_bytes]
-
-            # 如果最后一块不足 window_size，填充零
-            if len(chunk) < window_size_bytes:
-                chunk = chunk + b"\x00" * (window_size_bytes - len(chunk))
-
+        # 窗口为零拷贝切片，最后一块不足 window_size 时补零
+        for _, chunk in iter_windows(audio_bytes, window_size_bytes):
             # 调用 VAD 检测
             is_speech = await vad_adapter.detect(chunk)
 
-            # 记录概率用于调试
-            audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-            audio_tensor = torch.from_numpy(audio_float32).to(vad_adapter.device)
-            with torch.no_grad():
-                speech_prob = vad_adapter.model(
-                    audio_tensor, vad_adapter.sample_rate
-                ).item()
-                probs.append(speech_prob)
+            # 记录概率用于调试（直接读取 detect 的结果，不重复推理）
+            if vad_adapter.last_speech_prob is not None:
+                probs.append(vad_adapter.last_speech_prob)
 
             total_chunks += 1
 
@@ -221,7 +160,8 @@ async def test_tts_to_vad():
 
 if __name__ == "__main__":
     try:
-        result = asyncio.run(test_tts_to_vad())
-        sys.exit(0 if result else 1)
+        result = asyncio.run(test_tts_to_vad(), loop_factory=get_loop_factory())
+        # 跳过 (None) 不视为失败
+        sys.exit(1 if result is False else 0)
     except KeyboardInterrupt:
         pass
@@ -14,88 +14,55 @@ VAD 分段测试：模拟连续语音流，验证 VAD 正确分段
 使用真实代码，不进行 Mock。
 """
 import asyncio
-import io
+import hashlib
 import os
-import subprocess
 import sys
-import time
-
-import numpy as np
-import torch
+from pathlib import Path
 
 from backend.adapters.tts.edge_tts_adapter import EdgeTTSAdapter
 from backend.adapters.vad.silero_vad_adapter import SileroVADAdapter
 from backend.core.models import TextData
+from backend.utils.event_loop import get_loop_factory
+from tests.audio_utils import convert_mp3_to_pcm, edge_tts_reachable, iter_windows
 
+# TTS 生成的 PCM 缓存目录，避免每次运行都请求 Edge TTS；设置 REFRESH_TTS_CACHE=1 可强制重新生成
+TTS_CACHE_DIR = Path(__file__).resolve().parent / ".cache"
 
-def convert_mp3_to_pcm(mp3_bytes: bytes, target_sr: int = 16000) -> bytes:
-    """将 MP3 音频转换为 PCM 格式 (int16, mono)"""
-    # 尝试使用 pydub
-    try:
-        from pydub import AudioSegment
-        audio_f = io.BytesIO(mp3_bytes)
-        segment = AudioSegment.from_mp3(audio_f)
-
-        # 重采样
-        if segment.frame_rate != target_sr:
-            segment = segment.set_frame_rate(target_sr)
-
-        # 转单声道
-        if segment.channels > 1:
-            segment = segment.set_channels(1)
-
-        # 确保 16bit
-        if segment.sample_width != 2:
-            segment = segment.set_sample_width(2)
-
-        return segment.raw_data
-    except ImportError:
-        pass
-    except Exception as e:
-        print(f"Pydub 转换失败: {e}")
-
-    # 回退到 ffmpeg
-    try:
-        tmp_mp3 = f"/tmp/vad_segment_test_{int(time.time())}.mp3"
-        tmp_wav = f"/tmp/vad_segment_test_{int(time.time())}.wav"
 
-        with open(tmp_mp3, "wb") as f:
-            f.write(mp3_bytes)
+def _speech_cache_path(voice: str, sample_rate: int, text: str) -> Path:
+    """语音 PCM 缓存文件路径，按 (voice, sample_rate, text) 区分"""
+    cache_key = hashlib.sha256(f"{voice}|{sample_rate}|{text}".encode()).hexdigest()
+    return TTS_CACHE_DIR / f"{cache_key}.pcm"
 
-        subprocess.run(
-            ["ffmpeg", "-y", "-i", tmp_mp3, "-ar", str(target_sr), "-ac", "1", "-f", "wav", tmp_wav],
-            capture_output=True, check=True
-        )
 
-        with open(tmp_wav, "rb") as f:
-            # 跳过 WAV 头 (44字节)
-            f.seek(44)
-            return f.read()
+def _has_cached_speech(voice: str, sample_rate: int, text: str) -> bool:
+    """是否可以直接使用缓存的语音（REFRESH_TTS_CACHE 强制重新生成时返回 False）"""
+    return not os.getenv("REFRESH_TTS_CACHE") and _speech_cache_path(voice, sample_rate, text).exists()
 
-    except Exception as e:
-        print(f"FFmpeg 转换失败: {e}")
-        return None
-    finally:
-        if os.path.exists(tmp_mp3): os.remove(tmp_mp3)
-        if os.path.exists(tmp_wav): os.remove(tmp_wav)
 
+async def generate_speech(tts_adapter: EdgeTTSAdapter, text: str, sample_rate: int = 16000) -> bytes:
+    """生成一段语音的 PCM 数据，结果按 (voice, sample_rate, text) 缓存到磁盘"""
+    cache_path = _speech_cache_path(tts_adapter.voice, sample_rate, text)
+    if _has_cached_speech(tts_adapter.voice, sample_rate, text):
+        print(f"  使用缓存语音: '{text}'")
+        return cache_path.read_bytes()
 
-async def generate_speech(tts_adapter: EdgeTTSAdapter, text: str) -> bytes:
-    """生成一段语音的 PCM 数据"""
     print(f"  正在生成: '{text}'...")
     text_data = TextData(text=text)
-    audio_chunks = []
+    full_audio = bytearray()
 
     async for chunk in tts_adapter.synthesize_stream(text_data):
         if not chunk.is_final and chunk.data:
-            audio_chunks.append(chunk.data)
+            full_audio.extend(chunk.data)
 
-    full_audio = b"".join(audio_chunks)
-    pcm_data = convert_mp3_to_pcm(full_audio)
+    pcm_data = convert_mp3_to_pcm(full_audio, target_sr=sample_rate)
 
     if not pcm_data:
         raise RuntimeError(f"音频转换失败: {text}")
 
+    TTS_CACHE_DIR.mkdir(exist_ok=True)
+    cache_path.write_bytes(pcm_data)
+
     print(f"  生成的 PCM 数据大小: {len(pcm_data)} 字节")
     return pcm_data
 
@@ -115,11 +82,22 @@ async def run_vad_segmentation_test():
         "model_repo_path": "outputs/models/vad/silero-vad",
         "model_name": "silero_vad",
         "threshold": 0.5,
-        "device": "cpu",
+        # 默认自动选择 CUDA / MPS / CPU，可通过 VAD_TEST_DEVICE 强制指定（如 CPU-only CI）
+        "device": os.getenv("VAD_TEST_DEVICE", "auto"),
         "window_size_samples": 512,
         "sample_rate": 16000,
     }
 
+    # 语音全部命中缓存时无需网络；否则先快速检查 Edge TTS 是否可达，避免离线时长时间等待
+    speech_texts = ("你好", "再见")
+    all_cached = all(
+        _has_cached_speech(tts_config["voice"], vad_config["sample_rate"], text)
+        for text in speech_texts
+    )
+    if not all_cached and not edge_tts_reachable():
+        print("[SKIP] Edge TTS 服务不可达且没有缓存语音，跳过测试")
+        return None
+
     tts_adapter = EdgeTTSAdapter("tts-test", tts_config)
     vad_adapter = SileroVADAdapter("vad-test", vad_config)
 
@@ -132,22 +110,21 @@ async def run_vad_segmentation_test():
         print("\n[STEP 1] 准备测试音频流...")
 
         # 生成两个语音片段
-        speech1 = await generate_speech(tts_adapter, "你好")
-        speech2 = await generate_speech(tts_adapter, "再见")
+        speech1, speech2 = [await generate_speech(tts_adapter, text) for text in speech_texts]
 
         # 生成静音片段 (1秒)
         sample_rate = 16000
         sample_width = 2 # 16-bit
         silence_duration = 1.0
         silence_bytes = int(sample_rate * silence_duration * sample_width)
-        silence = b'\x00' * silence_bytes
+        silence = bytes(silence_bytes)
         print(f"  生成的静音数据大小: {len(silence)} 字节 ({silence_duration}s)")
 
         # 拼接音频流: 0.5s静音 + 语音1 + 1s静音 + 语音2 + 0.5s静音
-        pre_silence = b'\x00' * int(sample_rate * 0.5 * sample_width)
-        post_silence = b'\x00' * int(sample_rate * 0.5 * sample_width)
+        # 首尾静音长度相同，共用同一个缓冲区
+        edge_silence = bytes(int(sample_rate * 0.5 * sample_width))
 
-        full_stream = pre_silence + speech1 + silence + speech2 + post_silence
+        full_stream = b"".join((edge_silence, speech1, silence, speech2, edge_silence))
         print(f"\n[OK] 音频流拼接完成，总大小: {len(full_stream)} 字节 (约 {len(full_stream)/(16000*2):.2f}s)")
 
         # 3. 运行 VAD 检测
@@ -160,30 +137,15 @@ async def run_vad_segmentation_test():
 
         await vad_adapter.reset_state()
 
-        for i in range(0, len(full_stream), window_size_bytes):
-            chunk = full_stream[i : i + window_size_bytes]
-
-            # 填充最后一块
-            if len(chunk) < window_size_bytes:
-                chunk = chunk + b"\x00" * (window_size_bytes - len(chunk))
-
+        # 窗口为零拷贝切片，最后一块不足时补零
+        for i, chunk in iter_windows(full_stream, window_size_bytes):
             is_speech = await vad_adapter.detect(chunk)
 
-            # 获取内部概率用于分析
-            # 注意：实际生产中无法直接访问 model 和 internal state，这里仅用于验证测试
-            audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-            audio_tensor = torch.from_numpy(audio_float32).to(vad_adapter.device)
-            if audio_tensor.ndim == 1:
-                audio_tensor = audio_tensor.unsqueeze(0)
-
-            with torch.no_grad():
-                prob = vad_adapter.model(audio_tensor, vad_adapter.sample_rate).item()
-
+            # 读取 detect 本次计算的概率用于分析，不重复推理（重复调用还会推进模型的 RNN 状态）
             states.append({
                 "time": i / (sample_rate * 2), # 时间戳
                 "is_speech": is_speech,
-                "prob": prob
+                "prob": vad_adapter.last_speech_prob
             })
 
         print(f"[OK] VAD 处理完成，共处理 {len(states)} 帧")
@@ -235,7 +197,9 @@ async def run_vad_segmentation_test():
             for i in range(0, len(states), 10): # 每10帧打印一次
                 s = states[i]
                 marker = "#" if s["is_speech"] else "."
-                print(f"{s['time']:.2f}s [{marker}] prob={s['prob']:.4f}")
+                # 窗口未完成推理时概率为 None
+                prob = "n/a" if s["prob"] is None else f"{s['prob']:.4f}"
+                print(f"{s['time']:.2f}s [{marker}] prob={prob}")
 
             return False
 
@@ -262,7 +226,8 @@ async def run_vad_segmentation_test():
 
 if __name__ == "__main__":
     try:
-        success = asyncio.run(run_vad_segmentation_test())
-        sys.exit(0 if success else 1)
+        success = asyncio.run(run_vad_segmentation_test(), loop_factory=get_loop_factory())
+        # 跳过 (None) 不视为失败
+        sys.exit(1 if success is False else 0)
     except KeyboardInterrupt:
         pass